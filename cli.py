@@ -48,23 +48,57 @@ License: See LICENSE file
 
 import sys
 import argparse
-import configparser
 import asyncio
+from typing import Dict
 
 # Import AgenticSeek core modules
 from sources.llm_provider import Provider
 from sources.interaction import Interaction
 from sources.agents import Agent, CoderAgent, CasualAgent, FileAgent, PlannerAgent, BrowserAgent, McpAgent
 from sources.browser import Browser, create_driver
-from sources.utility import pretty_print
+from sources.utility import pretty_print, use_uvloop
+from sources.tools.app_config import load_app_config
 
 # Suppress warnings for cleaner CLI output
 import warnings
 warnings.filterwarnings("ignore")
 
-# Load configuration from config.ini
-config = configparser.ConfigParser()
-config.read('config.ini')
+# Use the libuv-based event loop when available (not supported on Windows)
+use_uvloop()
+
+CONFIG_PATH = 'config.ini'
+
+PROMPT_NAMES = ["casual_agent", "coder_agent", "file_agent", "browser_agent", "planner_agent"]
+
+def _read_text(path: str) -> str:
+    with open(path, 'r', encoding="utf-8") as f:
+        return f.read()
+
+async def _load_prompts(folder: str) -> Dict[str, str]:
+    """
+    Read every agent prompt of a personality folder concurrently.
+
+    Args:
+        folder: Personality folder under prompts/ (e.g. 'base' or 'jarvis')
+
+    Returns:
+        Dict[str, str]: Prompt name (e.g. 'coder_agent') -> prompt text
+    """
+    texts = await asyncio.gather(*(
+        asyncio.to_thread(_read_text, f"prompts/{folder}/{name}.txt") for name in PROMPT_NAMES
+    ))
+    return dict(zip(PROMPT_NAMES, texts))
+
+async def _close_browser(browser_task: asyncio.Future) -> None:
+    """Wait for a pending browser start and quit its driver."""
+    try:
+        browser = await browser_task
+    except BaseException:
+        return
+    try:
+        await asyncio.to_thread(browser.driver.quit)
+    except Exception as e:
+        pretty_print(f"Failed to close browser: {e}", color="warning")
 
 async def main():
     """
@@ -76,48 +110,70 @@ async def main():
     pretty_print("Initializing AgenticSeek CLI...", color="status")
     
     # Load configuration settings
-    stealth_mode = config.getboolean('BROWSER', 'stealth_mode')
-    personality_folder = "jarvis" if config.getboolean('MAIN', 'jarvis_personality') else "base"
-    languages = config["MAIN"]["languages"].split(' ')
+    cfg = load_app_config(CONFIG_PATH)
+    stealth_mode = cfg.stealth_mode
+    personality_folder = cfg.personality_folder
+    languages = cfg.languages
+    prompts = await _load_prompts(personality_folder)
 
     # Initialize LLM provider
-    provider = Provider(provider_name=config["MAIN"]["provider_name"],
-                        model=config["MAIN"]["provider_model"],
-                        server_address=config["MAIN"]["provider_server_address"],
-                        is_local=config.getboolean('MAIN', 'is_local'))
-
-    browser = Browser(
-        create_driver(headless=config.getboolean('BROWSER', 'headless_browser'), stealth_mode=stealth_mode, lang=languages[0]),
-        anticaptcha_manual_install=stealth_mode
-    )
-
-    agents = [
-        CasualAgent(name=config["MAIN"]["agent_name"],
-                    prompt_path=f"prompts/{personality_folder}/casual_agent.txt",
-                    provider=provider, verbose=False),
-        CoderAgent(name="coder",
-                   prompt_path=f"prompts/{personality_folder}/coder_agent.txt",
-                   provider=provider, verbose=False),
-        FileAgent(name="File Agent",
-                  prompt_path=f"prompts/{personality_folder}/file_agent.txt",
-                  provider=provider, verbose=False),
-        BrowserAgent(name="Browser",
-                     prompt_path=f"prompts/{personality_folder}/browser_agent.txt",
-                     provider=provider, verbose=False, browser=browser),
-        PlannerAgent(name="Planner",
-                     prompt_path=f"prompts/{personality_folder}/planner_agent.txt",
-                     provider=provider, verbose=False, browser=browser),
-        #McpAgent(name="MCP Agent",
-        #            prompt_path=f"prompts/{personality_folder}/mcp_agent.txt",
-        #            provider=provider, verbose=False), # NOTE under development
-    ]
-
-    interaction = Interaction(agents,
-                              tts_enabled=config.getboolean('MAIN', 'speak'),
-                              stt_enabled=config.getboolean('MAIN', 'listen'),
-                              recover_last_session=config.getboolean('MAIN', 'recover_last_session'),
-                              langs=languages
-                            )
+    provider = Provider(provider_name=cfg.provider_name,
+                        model=cfg.provider_model,
+                        server_address=cfg.provider_server_address,
+                        is_local=cfg.is_local)
+
+    def make_browser():
+        return Browser(
+            create_driver(headless=cfg.headless_browser, stealth_mode=stealth_mode, lang=languages[0]),
+            anticaptcha_manual_install=stealth_mode
+        )
+
+    # Agent construction loads prompts and memory models and the browser starts Chrome;
+    # build them in worker threads so the slow parts overlap instead of running back to back
+    browser_task = asyncio.ensure_future(asyncio.to_thread(make_browser))
+    try:
+        casual, coder, file_agent = await asyncio.gather(
+            asyncio.to_thread(CasualAgent, name=cfg.agent_name,
+                              prompt_path=f"prompts/{personality_folder}/casual_agent.txt",
+                              provider=provider, verbose=False, prompt=prompts["casual_agent"]),
+            asyncio.to_thread(CoderAgent, name="coder",
+                              prompt_path=f"prompts/{personality_folder}/coder_agent.txt",
+                              provider=provider, verbose=False, prompt=prompts["coder_agent"]),
+            asyncio.to_thread(FileAgent, name="File Agent",
+                              prompt_path=f"prompts/{personality_folder}/file_agent.txt",
+                              provider=provider, verbose=False, prompt=prompts["file_agent"]),
+        )
+        browser = await browser_task
+        browser_agent, planner = await asyncio.gather(
+            asyncio.to_thread(BrowserAgent, name="Browser",
+                              prompt_path=f"prompts/{personality_folder}/browser_agent.txt",
+                              provider=provider, verbose=False, browser=browser, prompt=prompts["browser_agent"]),
+            asyncio.to_thread(PlannerAgent, name="Planner",
+                              prompt_path=f"prompts/{personality_folder}/planner_agent.txt",
+                              provider=provider, verbose=False, browser=browser, prompt=prompts["planner_agent"]),
+        )
+
+        agents = [
+            casual,
+            coder,
+            file_agent,
+            browser_agent,
+            planner,
+            #McpAgent(name="MCP Agent",
+            #            prompt_path=f"prompts/{personality_folder}/mcp_agent.txt",
+            #            provider=provider, verbose=False), # NOTE under development
+        ]
+
+        interaction = Interaction(agents,
+                                  tts_enabled=cfg.speak,
+                                  stt_enabled=cfg.listen,
+                                  recover_last_session=cfg.recover_last_session,
+                                  langs=languages
+                                )
+    except BaseException:
+        # Don't leave Chrome running when an agent fails to build
+        await _close_browser(browser_task)
+        raise
     try:
         while interaction.is_active:
             interaction.get_user()
@@ -125,11 +181,11 @@ async def main():
                 interaction.show_answer()
                 interaction.speak_answer()
     except Exception as e:
-        if config.getboolean('MAIN', 'save_session'):
+        if cfg.save_session:
             interaction.save_session()
         raise e
     finally:
-        if config.getboolean('MAIN', 'save_session'):
+        if cfg.save_session:
             interaction.save_session()
 
 if __name__ == "__main__":
@@ -26,28 +26,43 @@ API Endpoints:
 
 Architecture:
 - Flask web framework for HTTP server
-- BeautifulSoup for HTML parsing
+- lxml for HTML parsing
 - Requests for HTTP client functionality
 - Modular search engine classes for extensibility
 
 Usage:
     python local_search.py
-    # Server runs on http://localhost:5000
+    # Server runs on http://localhost:8080 (waitress, 8 threads)
+    LOCAL_SEARCH_DEV=1 python local_search.py
+    # Use Flask's development server instead
 
 Author: AgenticSeek Team
 License: See LICENSE file
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import re
-from urllib.parse import quote, urlencode
-from flask import Flask, request, jsonify, render_template_string
-from bs4 import BeautifulSoup
+from urllib.parse import quote, urlencode, urlsplit, urlunsplit, parse_qsl
+from flask import Flask, Response, request, jsonify
+import orjson
+from flask_compress import Compress
+from lxml import html as lxml_html
+from concurrent.futures import ThreadPoolExecutor, Future
+from cachetools import TTLCache
+import threading
 import time
+import os
+
+# Request threads of the waitress server; the engine fetch pool is sized from it
+SERVER_THREADS = 8
 
 # Initialize Flask application
 app = Flask(__name__)
+# Compress responses (gzip/br) for clients that accept it
+Compress(app)
 
 # Simple HTML template for web interface
 HTML_TEMPLATE = """
@@ -86,6 +101,16 @@ HTML_TEMPLATE = """
 </html>
 """
 
+def normalize_url(url):
+    """
+    Normalize a URL for duplicate detection: lowercase scheme and host, strip the
+    trailing slash and fragment, and drop utm_* tracking parameters.
+    """
+    parts = urlsplit(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not k.startswith('utm_')])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
 class SearchEngine:
     """Base class for search engines"""
     
@@ -93,6 +118,13 @@ class SearchEngine:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Persistent session so repeated queries reuse keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def search(self, query, num_results=10):
         """Override in subclasses"""
@@ -112,8 +144,8 @@ class DuckDuckGoSearch(SearchEngine):
             }
             
             # Get instant answers first
-            response = requests.get('https://api.duckduckgo.com/', params=params, headers=self.headers, timeout=10)
-            data = response.json()
+            response = self.session.get('https://api.duckduckgo.com/', params=params, timeout=10)
+            data = orjson.loads(response.content)
             
             results = []
             
@@ -140,6 +172,9 @@ class DuckDuckGoSearch(SearchEngine):
             print(f"DuckDuckGo search error: {e}")
             return []
 
+# Matches <li> elements whose class list contains the b_algo token
+_BING_RESULT_XPATH = "//li[contains(concat(' ', normalize-space(@class), ' '), ' b_algo ')]"
+
 class BingSearch(SearchEngine):
     """Bing search engine (requires API key, but provides fallback)"""
     
@@ -147,31 +182,31 @@ class BingSearch(SearchEngine):
         try:
             # Simple Bing search (note: this is a basic scraper, may break)
             search_url = f"https://www.bing.com/search?q={quote(query)}"
-            response = requests.get(search_url, headers=self.headers, timeout=10)
+            response = self.session.get(search_url, timeout=10)
             
             if response.status_code != 200:
                 return []
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = lxml_html.fromstring(response.content)
             results = []
             
             # Parse Bing search results
-            for result in soup.find_all('li', class_='b_algo')[:num_results]:
-                title_elem = result.find('h2')
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    link = title_elem.find('a')
-                    url = link.get('href', '') if link else ''
-                    
-                    content_elem = result.find('p')
-                    content = content_elem.get_text(strip=True) if content_elem else ''
-                    
-                    if title and url:
-                        results.append({
-                            'title': title,
-                            'url': url,
-                            'content': content
-                        })
+            for result in tree.xpath(_BING_RESULT_XPATH)[:num_results]:
+                links = result.xpath('.//h2//a')
+                if not links:
+                    continue
+                link = links[0]
+                title = ' '.join(link.text_content().split())
+                url = link.get('href', '')
+                
+                content = ' '.join(result.xpath('string(.//p)').split())
+                
+                if title and url:
+                    results.append({
+                        'title': title,
+                        'url': url,
+                        'content': content
+                    })
             
             return results
             
@@ -182,42 +217,101 @@ class BingSearch(SearchEngine):
 class MetaSearch:
     """Meta-search engine that combines results from multiple sources"""
     
-    def __init__(self):
+    def __init__(self, threads=SERVER_THREADS):
         self.engines = {
             'duckduckgo': DuckDuckGoSearch(),
             'bing': BingSearch()
         }
+        # One worker per engine for every server thread, so a multi-engine query pays
+        # max(rtt), not sum(rtt), even when all server threads are searching at once
+        self._pool = ThreadPoolExecutor(max_workers=threads * len(self.engines))
+        # Short-lived result cache plus in-flight futures for identical queries
+        self._cache = TTLCache(maxsize=1024, ttl=60)
+        self._inflight = {}
+        self._lock = threading.Lock()
     
     def search(self, query, engines=['duckduckgo'], num_results=10):
+        """
+        Search with caching: identical queries within the TTL are served from
+        memory, and concurrent identical queries share a single upstream fetch.
+        """
+        key = (query, tuple(engines), num_results)
+        
+        with self._lock:
+            if key in self._cache:
+                return list(self._cache[key])
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            return list(future.result())
+        
+        try:
+            results = self._search_uncached(query, engines, num_results)
+            # Engines swallow their own errors and return [], so an empty result may be a
+            # transient failure (network, rate limit): don't pin it in the cache
+            if results:
+                with self._lock:
+                    self._cache[key] = results
+            future.set_result(results)
+            return list(results)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            if not future.done():
+                # Interrupted by a BaseException (KeyboardInterrupt, SystemExit): release the waiters too
+                future.set_exception(RuntimeError(f"Search for {query!r} was interrupted"))
+            with self._lock:
+                self._inflight.pop(key, None)
+    
+    def _search_uncached(self, query, engines, num_results):
         all_results = []
         
-        for engine_name in engines:
-            if engine_name in self.engines:
-                try:
-                    results = self.engines[engine_name].search(query, num_results)
-                    for result in results:
-                        result['engine'] = engine_name
-                    all_results.extend(results)
-                except Exception as e:
-                    print(f"Error with {engine_name}: {e}")
+        # Query all requested engines concurrently
+        futures = {
+            engine_name: self._pool.submit(self.engines[engine_name].search, query, num_results)
+            for engine_name in engines if engine_name in self.engines
+        }
         
-        # Remove duplicates based on URL
+        for engine_name, future in futures.items():
+            try:
+                results = future.result(timeout=15)
+                for result in results:
+                    result['engine'] = engine_name
+                all_results.extend(results)
+            except Exception as e:
+                print(f"Error with {engine_name}: {e}")
+        
+        # Remove duplicates based on normalized URL
         seen_urls = set()
         unique_results = []
         for result in all_results:
-            if result['url'] not in seen_urls:
-                seen_urls.add(result['url'])
-                unique_results.append(result)
+            key = normalize_url(result['url'])
+            if key in seen_urls:
+                continue
+            seen_urls.add(key)
+            unique_results.append(result)
         
         return unique_results[:num_results]
 
 # Initialize meta-search
 meta_search = MetaSearch()
 
+# Compile the HTML template once instead of re-parsing it on every request
+_TEMPLATE = app.jinja_env.from_string(HTML_TEMPLATE)
+
+def json_response(payload, status=200):
+    """Serialize payload with orjson for the hot search endpoints"""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
 @app.route('/')
 def index():
     """Main search page"""
-    return render_template_string(HTML_TEMPLATE)
+    return _TEMPLATE.render()
 
 @app.route('/search')
 def search():
@@ -229,21 +323,21 @@ def search():
     
     if not query:
         if format_type == 'json':
-            return jsonify({'error': 'No query provided'})
-        return render_template_string(HTML_TEMPLATE, query=query, results=[])
+            return json_response({'error': 'No query provided'})
+        return _TEMPLATE.render(query=query, results=[])
     
     # Perform search
     results = meta_search.search(query, engines=engines, num_results=num_results)
     
     if format_type == 'json':
-        return jsonify({
+        return json_response({
             'query': query,
             'engines': engines,
             'results': results,
             'total': len(results)
         })
     else:
-        return render_template_string(HTML_TEMPLATE, query=query, results=results)
+        return _TEMPLATE.render(query=query, results=results)
 
 @app.route('/api/search')
 def api_search():
@@ -253,11 +347,11 @@ def api_search():
     num_results = int(request.args.get('num', 10))
     
     if not query:
-        return jsonify({'error': 'No query provided'}), 400
+        return json_response({'error': 'No query provided'}, 400)
     
     results = meta_search.search(query, engines=engines, num_results=num_results)
     
-    return jsonify({
+    return json_response({
         'query': query,
         'engines': engines,
         'results': results,
@@ -274,4 +368,9 @@ if __name__ == '__main__':
     print("Web interface: http://127.0.0.1:8080")
     print("API endpoint: http://127.0.0.1:8080/api/search?q=your+query")
     print("Health check: http://127.0.0.1:8080/health")
-    app.run(host='127.0.0.1', port=8080, debug=True)
+    if os.getenv('LOCAL_SEARCH_DEV') == '1':
+        app.run(host='127.0.0.1', port=8080, threaded=True)
+    else:
+        # Multi-threaded WSGI server so concurrent searches don't serialize
+        from waitress import serve
+        serve(app, host='127.0.0.1', port=8080, threads=SERVER_THREADS)
@@ -6,13 +6,18 @@ Each agent runs as a separate process, allowing for fault isolation and hot-swap
 """
 
 import asyncio
-import subprocess
+import atexit
+import contextlib
+import functools
+import multiprocessing
+import os
+import runpy
 import sys
 import time
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Union
 import psutil
-import requests
-from dataclasses import dataclass
+import aiohttp
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
@@ -28,17 +33,168 @@ class AgentStatus(Enum):
     STOPPED = "stopped"
     RESTARTING = "restarting"
 
+class ForkedAgentProcess:
+    """
+    Wraps a multiprocessing.Process with the subset of the asyncio.subprocess.Process
+    interface the registry uses (pid, returncode, terminate, kill, wait)
+    """
+    
+    def __init__(self, process: multiprocessing.Process):
+        self._process = process
+    
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._process.exitcode
+    
+    def terminate(self):
+        self._process.terminate()
+    
+    def kill(self):
+        self._process.kill()
+    
+    async def wait(self) -> Optional[int]:
+        await asyncio.to_thread(self._process.join)
+        return self._process.exitcode
+
 @dataclass
 class AgentInfo:
     """Information about an individual agent"""
     name: str
     port: int
-    process: Optional[subprocess.Popen] = None
+    process: Optional[Union[asyncio.subprocess.Process, ForkedAgentProcess]] = None
     status: AgentStatus = AgentStatus.STOPPED
     last_health_check: float = 0
     restart_count: int = 0
     max_restarts: int = 3
     script_path: str = ""
+    last_restart_time: float = 0
+    backoff_until: float = 0
+    log_tasks: List[asyncio.Task] = field(default_factory=list)
+    # Time of the last health probe, successful or not (throttles the health monitor)
+    _last_probe: float = field(default=0, repr=False)
+
+async def _drain(stream: asyncio.StreamReader, sink: Callable[[str], None]):
+    """
+    Continuously read a subprocess pipe so the child never blocks on a full buffer
+    
+    Args:
+        stream: stdout or stderr of the agent process
+        sink: Callable receiving each decoded line
+    """
+    # Read in chunks rather than by line so one oversized line can't stop the drain
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        for line in chunk.decode(errors="replace").splitlines():
+            sink(line)
+
+# Modules shared by every agent server, imported once by the fork server
+AGENT_PRELOAD_MODULES = [
+    "fastapi",
+    "uvicorn",
+    "pydantic",
+    "mcp_agents.base_mcp_agent_server",
+    "sources.llm_provider",
+    "sources.agents",
+]
+
+def _module_name(script_path: str) -> str:
+    """Dotted module name of an agent server script path relative to the repository root"""
+    return os.path.splitext(os.path.normpath(script_path))[0].replace(os.sep, ".")
+
+def _terminate_process_trees(pids: List[int], timeout: float = 5):
+    """Terminate processes and all their descendants, killing whatever outlives the timeout"""
+    procs = []
+    for pid in pids:
+        try:
+            parent = psutil.Process(pid)
+            procs += parent.children(recursive=True) + [parent]
+        except psutil.NoSuchProcess:
+            pass
+    for proc in procs:
+        with contextlib.suppress(psutil.NoSuchProcess):
+            proc.terminate()
+    _, alive = psutil.wait_procs(procs, timeout=timeout)
+    for proc in alive:
+        with contextlib.suppress(psutil.NoSuchProcess):
+            proc.kill()
+
+def _run_agent_module(module: str, port: int):
+    """Entry point of a forked agent process: run the server module as __main__"""
+    sys.argv = [module, str(port)]
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+
+class AgentLauncher:
+    """
+    Starts agent server processes.
+    
+    Where available, agents are forked from a multiprocessing fork server that has
+    already imported AGENT_PRELOAD_MODULES, so each agent skips interpreter startup
+    and the heavy imports. The fork server is single-threaded, which keeps forking
+    safe even though the registry itself runs an event loop and worker threads.
+    On Windows, or with MCP_AGENT_LAUNCHER=subprocess, each agent gets a fresh interpreter.
+    """
+    
+    def __init__(self, preload: List[str] = AGENT_PRELOAD_MODULES):
+        self.use_fork = (
+            sys.platform != "win32"
+            and "forkserver" in multiprocessing.get_all_start_methods()
+            and os.getenv("MCP_AGENT_LAUNCHER", "fork") != "subprocess"
+        )
+        self._ctx = None
+        self._forked: List[multiprocessing.Process] = []
+        if self.use_fork:
+            self._ctx = multiprocessing.get_context("forkserver")
+            self._ctx.set_forkserver_preload(list(preload))
+            # multiprocessing joins its non-daemon children at exit, which would hang forever if the
+            # registry dies before stop_all_agents(); this runs first (atexit is LIFO) and stops them
+            atexit.register(self._terminate_forked)
+    
+    def _terminate_forked(self):
+        """Stop every forked agent process tree that is still running"""
+        _terminate_process_trees([process.pid for process in self._forked if process.is_alive()])
+    
+    async def launch(self, agent: AgentInfo) -> Union[asyncio.subprocess.Process, ForkedAgentProcess]:
+        """
+        Start the server process for an agent
+        
+        Args:
+            agent: The agent to start
+            
+        Returns:
+            The started process
+        """
+        if self.use_fork:
+            process = self._ctx.Process(
+                target=_run_agent_module,
+                args=(_module_name(agent.script_path), agent.port),
+                name=f"{agent.name}-agent"
+            )
+            # The first start boots the fork server and runs the preload, so keep it off the loop
+            await asyncio.to_thread(process.start)
+            self._forked = [p for p in self._forked if p.exitcode is None] + [process]
+            return ForkedAgentProcess(process)
+        
+        return await asyncio.create_subprocess_exec(
+            sys.executable, "-m", _module_name(agent.script_path), str(agent.port),
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+
+def _updates_status(method):
+    """Refresh the registry's status snapshot for the agent once the wrapped coroutine finishes"""
+    @functools.wraps(method)
+    async def wrapper(self, agent_name: str, *args, **kwargs):
+        try:
+            return await method(self, agent_name, *args, **kwargs)
+        finally:
+            if agent_name in self.agents:
+                self._refresh_status(agent_name)
+    return wrapper
 
 class AgentRegistry:
     """
@@ -90,15 +246,67 @@ class AgentRegistry:
             "casual": []  # No fallback for casual agent
         }
         
+        self.launcher = AgentLauncher()
         self.health_check_interval = 10  # seconds
-        self.health_monitor_running = False
+        self.startup_timeout = 60  # seconds to wait for a new agent to become healthy (includes building the agent)
+        self.startup_poll_interval = 0.15  # seconds between readiness probes
+        self.max_restart_backoff = 60  # seconds
+        self.restart_decay_seconds = 300  # healthy time after a restart before restart_count resets
+        self._stop_event = asyncio.Event()  # Set to wake and stop the health monitor
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Snapshot served by get_agent_status, updated on state transitions
+        self._status_cache: Dict[str, Dict] = {}
+        for agent_name in self.agents:
+            self._refresh_status(agent_name)
     
-    async def start_agent(self, agent_name: str) -> bool:
+    def _refresh_status(self, agent_name: str):
+        """
+        Rebuild the cached status entry of an agent
+        
+        Args:
+            agent_name: Name of the agent to refresh
+        """
+        agent = self.agents[agent_name]
+        self._status_cache[agent_name] = {
+            "status": agent.status.value,
+            "port": agent.port,
+            "restart_count": agent.restart_count,
+            "last_restart_time": agent.last_restart_time,
+            "backoff_until": agent.backoff_until,
+            "last_health_check": agent.last_health_check,
+            "process_id": agent.process.pid if agent.process else None,
+            "running": agent.process.returncode is None if agent.process else False
+        }
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create the shared HTTP session used for health checks
+        
+        The session must be created inside a running event loop, so it cannot
+        be built in __init__.
+        
+        Returns:
+            aiohttp.ClientSession: The shared session
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+        return self._session
+    
+    async def close_session(self):
+        """Close the shared HTTP session if it is open"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @_updates_status
+    async def start_agent(self, agent_name: str, stop_event: Optional[asyncio.Event] = None) -> bool:
         """
         Start an individual agent MCP server
         
         Args:
             agent_name: Name of the agent to start
+            stop_event: Abandon the readiness wait (and stop the agent) once this event is set
             
         Returns:
             bool: True if started successfully, False otherwise
@@ -110,7 +318,7 @@ class AgentRegistry:
         agent = self.agents[agent_name]
         
         # Stop existing process if running
-        if agent.process and agent.process.poll() is None:
+        if agent.process and agent.process.returncode is None:
             logger.info(f"Stopping existing {agent_name} agent process")
             await self.stop_agent(agent_name)
         
@@ -119,24 +327,41 @@ class AgentRegistry:
             agent.status = AgentStatus.STARTING
             
             # Start the agent process
-            agent.process = subprocess.Popen([
-                sys.executable, agent.script_path, str(agent.port)
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            agent.process = await self.launcher.launch(agent)
             
-            # Wait for startup
-            await asyncio.sleep(3)
+            # Drain the pipes in the background so verbose agents don't stall
+            # (forked agents inherit the registry's stdout/stderr instead)
+            if not isinstance(agent.process, ForkedAgentProcess):
+                agent.log_tasks = [
+                    asyncio.create_task(_drain(agent.process.stdout, lambda line: logger.debug(f"[{agent_name}] {line}"))),
+                    asyncio.create_task(_drain(agent.process.stderr, lambda line: logger.debug(f"[{agent_name}] {line}")))
+                ]
             
-            # Check if process started successfully
-            if agent.process.poll() is None:
-                # Verify health
-                if await self.check_agent_health(agent_name):
+            # Probe readiness until the agent answers, crashes, or the deadline passes
+            deadline = time.monotonic() + self.startup_timeout
+            while time.monotonic() < deadline:
+                if agent.process.returncode is not None:
+                    break  # Process exited during startup
+                if await self.check_agent_health(agent_name, log_failures=False):
                     agent.status = AgentStatus.RUNNING
                     logger.info(f"✅ {agent_name} agent started successfully on port {agent.port}")
                     return True
-                else:
-                    logger.error(f"❌ {agent_name} agent started but health check failed")
-                    await self.stop_agent(agent_name)
-                    return False
+                if stop_event is None:
+                    await asyncio.sleep(self.startup_poll_interval)
+                    continue
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.startup_poll_interval)
+                except asyncio.TimeoutError:
+                    continue
+                logger.info(f"🛑 Shutdown requested, abandoning {agent_name} agent startup")
+                await self.stop_agent(agent_name)
+                return False
+            
+            # Check if process started successfully
+            if agent.process.returncode is None:
+                logger.error(f"❌ {agent_name} agent started but health check failed")
+                await self.stop_agent(agent_name)
+                return False
             else:
                 logger.error(f"❌ {agent_name} agent process failed to start")
                 agent.status = AgentStatus.CRASHED
@@ -147,6 +372,7 @@ class AgentRegistry:
             agent.status = AgentStatus.CRASHED
             return False
     
+    @_updates_status
     async def stop_agent(self, agent_name: str) -> bool:
         """
         Stop an individual agent MCP server
@@ -164,19 +390,38 @@ class AgentRegistry:
         agent = self.agents[agent_name]
         
         try:
-            if agent.process and agent.process.poll() is None:
+            if agent.process and agent.process.returncode is None:
                 logger.info(f"Stopping {agent_name} agent (PID: {agent.process.pid})")
                 
-                # Try graceful shutdown first
+                # Collect any workers the agent forked so they don't outlive it and hold its port
+                try:
+                    children = psutil.Process(agent.process.pid).children(recursive=True)
+                except psutil.NoSuchProcess:
+                    children = []
+                
+                # Try graceful shutdown first, children before the parent
+                for child in children:
+                    try:
+                        child.terminate()
+                    except psutil.NoSuchProcess:
+                        pass
                 agent.process.terminate()
                 
                 # Wait for graceful shutdown
                 try:
-                    agent.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
+                    await asyncio.wait_for(agent.process.wait(), timeout=5)
+                except asyncio.TimeoutError:
                     logger.warning(f"Force killing {agent_name} agent")
                     agent.process.kill()
-                    agent.process.wait()
+                    await agent.process.wait()
+                
+                _, alive = await asyncio.to_thread(psutil.wait_procs, children, timeout=5)
+                for child in alive:
+                    logger.warning(f"Force killing {agent_name} agent child process (PID: {child.pid})")
+                    try:
+                        child.kill()
+                    except psutil.NoSuchProcess:
+                        pass
                 
                 agent.status = AgentStatus.STOPPED
                 logger.info(f"✅ {agent_name} agent stopped successfully")
@@ -190,12 +435,14 @@ class AgentRegistry:
             logger.error(f"❌ Error stopping {agent_name} agent: {str(e)}")
             return False
     
-    async def check_agent_health(self, agent_name: str) -> bool:
+    @_updates_status
+    async def check_agent_health(self, agent_name: str, log_failures: bool = True) -> bool:
         """
         Check if an agent is healthy by sending a health check request
         
         Args:
             agent_name: Name of the agent to check
+            log_failures: Log a warning when the check fails (disabled for startup probes)
             
         Returns:
             bool: True if agent is healthy, False otherwise
@@ -204,29 +451,32 @@ class AgentRegistry:
             return False
         
         agent = self.agents[agent_name]
+        agent._last_probe = time.time()
         
         try:
-            # Send health check request
-            response = requests.get(
-                f"http://localhost:{agent.port}/health",
-                timeout=5
-            )
+            # Send a header-only health check request without blocking the event loop
+            session = await self._ensure_session()
+            async with session.head(f"http://localhost:{agent.port}/health") as response:
+                status_code = response.status
             
-            if response.status_code == 200:
+            if status_code == 200:
                 agent.last_health_check = time.time()
                 if agent.status == AgentStatus.CRASHED:
                     agent.status = AgentStatus.RUNNING
                 return True
             else:
-                logger.warning(f"Health check failed for {agent_name}: HTTP {response.status_code}")
+                if log_failures:
+                    logger.warning(f"Health check failed for {agent_name}: HTTP {status_code}")
                 return False
                 
         except Exception as e:
-            logger.warning(f"Health check failed for {agent_name}: {str(e)}")
+            if log_failures:
+                logger.warning(f"Health check failed for {agent_name}: {str(e)}")
             if agent.status == AgentStatus.RUNNING:
                 agent.status = AgentStatus.CRASHED
             return False
     
+    @_updates_status
     async def restart_agent(self, agent_name: str) -> bool:
         """
         Restart a crashed agent with restart count limits
@@ -253,11 +503,23 @@ class AgentRegistry:
             agent.status = AgentStatus.RESTARTING
             agent.restart_count += 1
             
-            # Stop and start the agent
+            # Stop the agent, then back off exponentially (1s, 2s, 4s, ...) before starting it again
             await self.stop_agent(agent_name)
-            await asyncio.sleep(2)  # Brief pause before restart
+            backoff = min(2 ** (agent.restart_count - 1), self.max_restart_backoff)
+            agent.backoff_until = time.time() + backoff
             
-            if await self.start_agent(agent_name):
+            # Wait out the backoff, but give up at once if the health monitor is being stopped
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=backoff)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                logger.info(f"🛑 Shutdown requested, not restarting {agent_name} agent")
+                agent.status = AgentStatus.STOPPED
+                return False
+            
+            agent.last_restart_time = time.time()
+            if await self.start_agent(agent_name, stop_event=self._stop_event):
                 logger.info(f"✅ {agent_name} agent restarted successfully")
                 return True
             else:
@@ -297,6 +559,27 @@ class AgentRegistry:
         # Return fallbacks that are currently healthy
         return [agent for agent in fallbacks if agent in healthy_agents]
     
+    def _collect_results(self, names: List[str], outcomes: List, action: str) -> Dict[str, bool]:
+        """
+        Map gathered outcomes back to agent names, treating exceptions as failures
+        
+        Args:
+            names: Agent names in the order they were gathered
+            outcomes: Results returned by asyncio.gather(..., return_exceptions=True)
+            action: Verb used in the error log (e.g. 'starting')
+            
+        Returns:
+            Dict[str, bool]: Agent name -> success status
+        """
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ Error {action} {name} agent: {str(outcome)}")
+                results[name] = False
+            else:
+                results[name] = outcome
+        return results
+    
     async def start_all_agents(self) -> Dict[str, bool]:
         """
         Start all agents
@@ -305,10 +588,14 @@ class AgentRegistry:
             Dict[str, bool]: Agent name -> success status
         """
         logger.info("🚀 Starting all agent servers...")
-        results = {}
         
-        for agent_name in self.agents.keys():
-            results[agent_name] = await self.start_agent(agent_name)
+        # Launch every agent concurrently so the startup waits overlap
+        names = list(self.agents)
+        outcomes = await asyncio.gather(
+            *(self.start_agent(name) for name in names),
+            return_exceptions=True
+        )
+        results = self._collect_results(names, outcomes, "starting")
         
         healthy_count = sum(results.values())
         total_count = len(results)
@@ -324,10 +611,13 @@ class AgentRegistry:
             Dict[str, bool]: Agent name -> success status
         """
         logger.info("🛑 Stopping all agent servers...")
-        results = {}
         
-        for agent_name in self.agents.keys():
-            results[agent_name] = await self.stop_agent(agent_name)
+        names = list(self.agents)
+        outcomes = await asyncio.gather(
+            *(self.stop_agent(name) for name in names),
+            return_exceptions=True
+        )
+        results = self._collect_results(names, outcomes, "stopping")
         
         logger.info("✅ All agents stopped")
         return results
@@ -335,30 +625,60 @@ class AgentRegistry:
     async def start_health_monitor(self):
         """Start continuous health monitoring of all agents"""
         logger.info("🏥 Starting agent health monitor...")
-        self.health_monitor_running = True
+        self._stop_event.clear()
         
-        while self.health_monitor_running:
+        while not self._stop_event.is_set():
             try:
-                for agent_name in self.agents.keys():
-                    # Only check agents that should be running
-                    if self.agents[agent_name].status in [AgentStatus.RUNNING, AgentStatus.CRASHED]:
-                        is_healthy = await self.check_agent_health(agent_name)
-                        
-                        # Auto-restart crashed agents
-                        if not is_healthy and self.agents[agent_name].status == AgentStatus.CRASHED:
-                            logger.warning(f"🚨 {agent_name} agent is down, attempting restart...")
-                            await self.restart_agent(agent_name)
+                # Only check agents that should be running and weren't probed recently
+                # (e.g. by the startup readiness loop)
+                cooldown = self.health_check_interval * 0.5
+                now = time.time()
+                names_to_check = [
+                    name for name, agent in self.agents.items()
+                    if agent.status in [AgentStatus.RUNNING, AgentStatus.CRASHED]
+                    and now - agent._last_probe >= cooldown
+                ]
+                await asyncio.gather(*(self._monitor_agent(name) for name in names_to_check))
                 
-                await asyncio.sleep(self.health_check_interval)
+                # Pick up processes that exited on their own since the last tick
+                for agent_name in self.agents:
+                    self._refresh_status(agent_name)
                 
             except Exception as e:
                 logger.error(f"❌ Error in health monitor: {str(e)}")
-                await asyncio.sleep(self.health_check_interval)
+            
+            # Sleep until the next tick, or return immediately when stop is requested
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=self.health_check_interval)
+            except asyncio.TimeoutError:
+                pass
     
-    def stop_health_monitor(self):
-        """Stop the health monitor"""
+    async def _monitor_agent(self, agent_name: str):
+        """
+        Run one health check for an agent and restart it if it has crashed
+        
+        Args:
+            agent_name: Name of the agent to check
+        """
+        agent = self.agents[agent_name]
+        is_healthy = await self.check_agent_health(agent_name)
+        
+        # Forgive past restarts once the agent has stayed healthy long enough
+        if (is_healthy and agent.restart_count > 0
+                and time.time() - agent.last_restart_time > self.restart_decay_seconds):
+            logger.info(f"{agent_name} agent stable for {self.restart_decay_seconds}s, resetting restart count")
+            agent.restart_count = 0
+        
+        # Auto-restart crashed agents
+        if not is_healthy and self.agents[agent_name].status == AgentStatus.CRASHED:
+            logger.warning(f"🚨 {agent_name} agent is down, attempting restart...")
+            await self.restart_agent(agent_name)
+    
+    async def stop_health_monitor(self):
+        """Stop the health monitor and release its HTTP session"""
         logger.info("🏥 Stopping agent health monitor...")
-        self.health_monitor_running = False
+        self._stop_event.set()
+        await self.close_session()
     
     def get_agent_status(self) -> Dict[str, Dict]:
         """
@@ -367,17 +687,7 @@ class AgentRegistry:
         Returns:
             Dict: Agent status information
         """
-        status = {}
-        for name, agent in self.agents.items():
-            status[name] = {
-                "status": agent.status.value,
-                "port": agent.port,
-                "restart_count": agent.restart_count,
-                "last_health_check": agent.last_health_check,
-                "process_id": agent.process.pid if agent.process else None,
-                "running": agent.process.poll() is None if agent.process else False
-            }
-        return status
+        return {name: status.copy() for name, status in self._status_cache.items()}
 
 # Singleton instance
 agent_registry = AgentRegistry()
@@ -400,8 +710,12 @@ if __name__ == "__main__":
             logger.info("Shutting down...")
         finally:
             # Clean shutdown
-            registry.stop_health_monitor()
+            await registry.stop_health_monitor()
             await health_task
             await registry.stop_all_agents()
     
+    from sources.utility import use_uvloop
+    
+    # Use the libuv-based event loop when available (not supported on Windows)
+    use_uvloop()
     asyncio.run(main())
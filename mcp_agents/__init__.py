@@ -0,0 +1,3 @@
+"""
+MCP agent servers, one process per agent (run with python -m mcp_agents.<name>_agent_server <port>).
+"""
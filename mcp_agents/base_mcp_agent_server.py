@@ -6,17 +6,32 @@ Each agent runs as a separate process with fault isolation.
 """
 
 import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import os
+import orjson
 import sys
-import traceback
-from typing import Dict, Any, Optional
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Any, Optional
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from cachetools import TTLCache
+from pydantic import BaseModel, ValidationError
 import uvicorn
 import logging
 
+from mcp_agents.semantic_cache import SemanticCache
+from sources.llm_provider import close_http_clients
+from sources.utility import UVICORN_HTTP, UVICORN_LOOP
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Named explicitly so the compiled copy of this module logs under the same name
+logger = logging.getLogger("mcp_agents.base_mcp_agent_server")
 
 class QueryRequest(BaseModel):
     """Request model for agent queries"""
@@ -34,6 +49,42 @@ class QueryResponse(BaseModel):
     success: bool
     error: Optional[str] = None
 
+def _parse_query_request(body: bytes) -> QueryRequest:
+    """
+    Parse and validate a /query body in a single pydantic-core pass
+    
+    Raises:
+        RequestValidationError: Same 422 response FastAPI gives for a declared body model
+    """
+    try:
+        return QueryRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body)
+
+def _canonical_key(query: str, context: Optional[Dict], parameters: Optional[Dict]) -> bytes:
+    """Canonical (key-sorted) JSON form of a query request"""
+    return orjson.dumps((query, context, parameters), default=str, option=orjson.OPT_SORT_KEYS)
+
+def _cache_key(query: str, context: Optional[Dict], parameters: Optional[Dict]) -> bytes:
+    """Hash the canonical JSON form of a query request into a response-cache key"""
+    return hashlib.blake2b(_canonical_key(query, context, parameters), digest_size=16).digest()
+
+def response_cache_opted_in(agent_name: str) -> bool:
+    """
+    Whether RESPONSE_CACHE_AGENTS (comma-separated agent names) opts this agent into the response cache
+    
+    Every agent answers from its conversation memory and a cache hit skips the memory update,
+    so a cached answer to a follow-up like "yes" may come from another context. Off by default.
+    """
+    names = os.getenv("RESPONSE_CACHE_AGENTS", "")
+    return agent_name in {name.strip() for name in names.split(",")}
+
+def _json_response(body: bytes, cache_status: Optional[str] = None) -> Response:
+    """Wrap pre-encoded JSON bytes in a response, tagging the cache outcome if any"""
+    headers = {"X-Cache": cache_status} if cache_status else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
 class BaseMCPAgentServer:
     """
     Base class for MCP Agent Servers
@@ -42,58 +93,130 @@ class BaseMCPAgentServer:
     This provides standardized health checks, error handling, and API endpoints.
     """
     
-    def __init__(self, agent_name: str, agent_instance):
+    def __init__(self, agent_name: str, agent_instance=None, agent_factory: Optional[Callable[[], Any]] = None,
+                 cache_responses: bool = False):
         """
         Initialize the base MCP agent server
         
         Args:
             agent_name: Name of the agent (e.g., 'browser', 'code')
             agent_instance: Instance of the actual agent class
+            agent_factory: Callable building the agent instead, run in a worker thread
+                once the server process is up (so each Gunicorn worker gets its own)
+            cache_responses: Serve repeated queries from a response cache, only safe for
+                agents without side effects (see response_cache_opted_in)
         """
+        if agent_instance is None and agent_factory is None:
+            raise ValueError("Either agent_instance or agent_factory is required")
         self.agent_name = agent_name
-        self.agent = agent_instance
-        self.app = FastAPI(title=f"{agent_name.title()} Agent MCP Server")
+        self.agent = None
+        self._dispatch = None
+        self._status_body: Optional[bytes] = None
+        # /health body up to the per-request timestamp
+        self._health_prefix = orjson.dumps({"status": "healthy", "agent": agent_name})[:-1] + b',"timestamp":'
+        self._agent_factory = agent_factory or (lambda: agent_instance)
+        self._agent_lock = threading.Lock()
+        self._agent_error: Optional[str] = None
+        if agent_factory is None:
+            self._load_agent()
+        self.app = FastAPI(title=f"{agent_name.title()} Agent MCP Server", lifespan=self.lifespan)
+        
+        # Exact-match cache of successful /query responses
+        self.cache_enabled = cache_responses
+        self._response_cache = TTLCache(maxsize=1024, ttl=300)
+        self._cache_lock = asyncio.Lock()
+        
+        # Near-duplicate cache keyed on query embeddings, opt-in with SEMANTIC_CACHE=1: it answers
+        # with a different query's response and downloads an embedding model on first use
+        self.semantic_cache = None
+        if self.cache_enabled and os.getenv("SEMANTIC_CACHE") == "1":
+            if importlib.util.find_spec("sentence_transformers") is not None:
+                self.semantic_cache = SemanticCache(capacity=512, threshold=0.93)
+            else:
+                logger.warning("⚠️ sentence-transformers not installed (pip install agenticseek[semantic-cache]), semantic cache disabled")
+        
         self.setup_routes()
         
     def setup_routes(self):
         """Setup FastAPI routes for the agent server"""
         
-        @self.app.get("/health")
+        @self.app.api_route("/health", methods=["GET", "HEAD"])
         async def health_check():
             """Health check endpoint"""
-            return {
-                "status": "healthy",
-                "agent": self.agent_name,
-                "timestamp": asyncio.get_event_loop().time()
-            }
+            if self._agent_error is not None:
+                return JSONResponse(status_code=503, content={
+                    "status": "unhealthy",
+                    "agent": self.agent_name,
+                    "error": self._agent_error
+                })
+            if self.agent is None:
+                # Still building in _warm_up: not ready for queries yet
+                return JSONResponse(status_code=503, content={
+                    "status": "starting",
+                    "agent": self.agent_name
+                })
+            return _json_response(self._health_prefix + repr(time.monotonic()).encode() + b"}")
         
-        @self.app.post("/query", response_model=QueryResponse)
-        async def execute_query(request: QueryRequest):
+        # The body is read raw and validated with model_validate_json rather than declared as a
+        # QueryRequest parameter, which would json.loads it first; the schema is kept for the docs
+        @self.app.post("/query", response_model=QueryResponse, openapi_extra={"requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": QueryRequest.model_json_schema()}},
+        }})
+        async def execute_query(raw_request: Request):
             """Execute a query using this agent"""
+            request = _parse_query_request(await raw_request.body())
+            # Responses are encoded once with orjson; the caches hold the encoded bytes
+            cache_key = None
+            cache_status = None
+            if self.cache_enabled:
+                cache_key = _cache_key(request.query, request.context, request.parameters)
+                async with self._cache_lock:
+                    cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    return _json_response(cached, "HIT")
+                cache_status = "MISS"
+            
+            # Only context-free queries are matched semantically, context changes the answer
+            embedding = None
+            if self.semantic_cache is not None and not request.context and not request.parameters:
+                try:
+                    cached, embedding = await asyncio.to_thread(self.semantic_cache.lookup, request.query)
+                except Exception as e:
+                    logger.warning("⚠️ Semantic cache lookup failed: %s", e)
+                    cached = None
+                if cached is not None:
+                    return _json_response(cached, "SEMANTIC-HIT")
+            
             try:
-                logger.info(f"📝 {self.agent_name} agent received query: {request.query[:100]}...")
+                logger.info("📝 %s agent received query: %s...", self.agent_name, request.query[:100])
                 
                 # Execute the agent's query processing
                 result = await self.execute_agent_query(request.query, request.context, request.parameters)
                 
-                # Format the response
-                response = QueryResponse(
-                    answer=result.get("answer", ""),
-                    reasoning=result.get("reasoning", ""),
-                    agent_name=self.agent_name,
-                    status=result.get("status", "completed"),
-                    blocks=result.get("blocks", {}),
-                    success=True,
-                    error=None
-                )
+                # Format the response (trusted internal data, serialized without model validation)
+                body = orjson.dumps({
+                    "answer": result.get("answer", ""),
+                    "reasoning": result.get("reasoning", ""),
+                    "agent_name": self.agent_name,
+                    "status": result.get("status", "completed"),
+                    "blocks": result.get("blocks", {}),
+                    "success": True,
+                    "error": None
+                }, default=str, option=orjson.OPT_NON_STR_KEYS)
+                
+                if cache_key is not None:
+                    async with self._cache_lock:
+                        self._response_cache[cache_key] = body
+                if embedding is not None:
+                    self.semantic_cache.add(embedding, body)
                 
-                logger.info(f"✅ {self.agent_name} agent completed query successfully")
-                return response
+                logger.info("✅ %s agent completed query successfully", self.agent_name)
+                return _json_response(body, cache_status)
                 
             except Exception as e:
                 error_msg = f"Error in {self.agent_name} agent: {str(e)}"
-                logger.error(f"❌ {error_msg}")
-                logger.error(traceback.format_exc())
+                logger.exception("❌ %s", error_msg)
                 
                 # Return error response
                 return QueryResponse(
@@ -109,13 +232,82 @@ class BaseMCPAgentServer:
         @self.app.get("/status")
         async def get_status():
             """Get detailed agent status"""
+            if self._status_body is None:
+                await asyncio.to_thread(self._load_agent)
+            return _json_response(self._status_body)
+    
+    @contextlib.asynccontextmanager
+    async def lifespan(self, app: FastAPI):
+        """
+        Start building the agent in the background as soon as the server process is up,
+        and release the provider's shared HTTP connection pools on shutdown
+        """
+        warm_up = asyncio.create_task(self._warm_up()) if self.agent is None else None
+        yield
+        if warm_up is not None and not warm_up.done():
+            warm_up.cancel()
+        close_http_clients()
+    
+    async def _warm_up(self):
+        """Build the agent off the event loop, reporting failures through /health"""
+        try:
+            await asyncio.to_thread(self._load_agent)
+            logger.info("✅ %s agent ready", self.agent_name)
+        except Exception as e:
+            self._agent_error = str(e)
+            logger.exception("❌ Failed to initialize %s agent: %s", self.agent_name, e)
+    
+    def _load_agent(self):
+        """
+        Build the agent on first use and resolve its dispatch and status fields
+        
+        Returns:
+            The agent instance
+        """
+        with self._agent_lock:
+            if self.agent is None:
+                agent = self._agent_factory()
+                self._dispatch = self._resolve_dispatch(agent)
+                self._status_body = orjson.dumps({
+                    "agent_name": self.agent_name,
+                    "status": "running",
+                    "capabilities": getattr(agent, 'capabilities', []),
+                    "description": getattr(agent, 'description', f"{self.agent_name} agent"),
+                    "version": getattr(agent, 'version', '1.0.0')
+                }, default=str)
+                self.agent = agent
+                self._agent_error = None
+        return self.agent
+        
+    @staticmethod
+    def _resolve_dispatch(agent) -> Optional[Callable[[str], Awaitable[Dict[str, Any]]]]:
+        """
+        Pick the agent entry point once, preferring execute() over process()
+        
+        Args:
+            agent: The agent instance
+            
+        Returns:
+            Coroutine function taking the query and returning the result dict, or None
+        """
+        execute = getattr(agent, 'execute', None)
+        if execute is not None:
+            return execute
+        process = getattr(agent, 'process', None)
+        if process is None:
+            return None
+        
+        async def run_process(query: str) -> Dict[str, Any]:
+            # The process method expects (prompt, speech_module) and returns (answer, reasoning)
+            answer, reasoning = await process(query, None)  # speech_module is None for MCP
             return {
-                "agent_name": self.agent_name,
-                "status": "running",                "capabilities": getattr(self.agent, 'capabilities', []),
-                "description": getattr(self.agent, 'description', f"{self.agent_name} agent"),
-                "version": getattr(self.agent, 'version', '1.0.0')
+                "answer": answer,
+                "reasoning": reasoning,
+                "status": "completed",
+                "blocks": {}
             }
-        
+        return run_process
+    
     async def execute_agent_query(self, query: str, context: Optional[Dict] = None, parameters: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Execute a query using the agent instance
@@ -131,20 +323,11 @@ class BaseMCPAgentServer:
         Returns:
             Dict containing the agent's response
         """
-        # Try to call the agent's execute method first
-        if hasattr(self.agent, 'execute'):
-            return await self.agent.execute(query)
-        elif hasattr(self.agent, 'process'):
-            # The process method expects (prompt, speech_module) and returns (answer, reasoning)
-            answer, reasoning = await self.agent.process(query, None)  # speech_module is None for MCP
-            return {
-                "answer": answer,
-                "reasoning": reasoning,
-                "status": "completed",
-                "blocks": {}
-            }
-        else:
+        if self.agent is None:
+            await asyncio.to_thread(self._load_agent)
+        if self._dispatch is None:
             raise NotImplementedError(f"Agent {self.agent_name} does not implement execute() or process() method")
+        return await self._dispatch(query)
     
     def run(self, port: int):
         """
@@ -153,19 +336,59 @@ class BaseMCPAgentServer:
         Args:
             port: Port number to run the server on
         """
-        logger.info(f"🚀 Starting {self.agent_name} agent server on port {port}")
+        logger.info("🚀 Starting %s agent server on port %d", self.agent_name, port)
+        
+        workers = int(os.getenv("WORKERS", "1"))
+        if workers > 1:
+            try:
+                self.run_workers(port, workers)
+                return
+            except ImportError:
+                logger.warning("gunicorn is not installed, falling back to a single uvicorn worker")
         
         try:
             uvicorn.run(
                 self.app,
                 host="127.0.0.1",
                 port=port,
+                loop=UVICORN_LOOP,
+                http=UVICORN_HTTP,
                 log_level="info",
-                access_log=True
+                # Per-request access lines are synchronous logging on the event loop (enable with ACCESS_LOG=1)
+                access_log=os.getenv("ACCESS_LOG") == "1"
             )
         except Exception as e:
-            logger.error(f"❌ Failed to start {self.agent_name} agent server: {str(e)}")
+            logger.error("❌ Failed to start %s agent server: %s", self.agent_name, e)
             sys.exit(1)
+    
+    def run_workers(self, port: int, workers: int):
+        """
+        Run the agent server as several Gunicorn worker processes using UvicornWorker
+        
+        Each worker is a full copy of the agent (LLM provider, browser, ...), so memory
+        use grows roughly linearly with the number of workers. Not available on Windows.
+        
+        Args:
+            port: Port number to run the server on
+            workers: Number of worker processes
+        """
+        from gunicorn.app.base import BaseApplication
+        
+        app = self.app
+        
+        class AgentApplication(BaseApplication):
+            def load_config(self):
+                self.cfg.set("bind", f"127.0.0.1:{port}")
+                self.cfg.set("workers", workers)
+                self.cfg.set("worker_class", "uvicorn.workers.UvicornWorker")
+                # The app is built once in the master; agents are built per worker by the lifespan hook
+                self.cfg.set("preload_app", True)
+            
+            def load(self):
+                return app
+        
+        logger.info("Running %s agent server with %d gunicorn workers", self.agent_name, workers)
+        AgentApplication().run()
 
 def create_agent_server(agent_name: str, agent_class, port: int):
     """
@@ -180,34 +403,33 @@ def create_agent_server(agent_name: str, agent_class, port: int):
         # Create agent wrapper instance
         agent_wrapper = agent_class()
         
-        # Extract the actual agent instance from the wrapper
-        actual_agent = None
-        if hasattr(agent_wrapper, f'{agent_name}_agent'):
-            actual_agent = getattr(agent_wrapper, f'{agent_name}_agent')
-        elif hasattr(agent_wrapper, 'browser_agent'):
-            actual_agent = agent_wrapper.browser_agent
-        elif hasattr(agent_wrapper, 'code_agent'):
-            actual_agent = agent_wrapper.code_agent
-        elif hasattr(agent_wrapper, 'file_agent'):
-            actual_agent = agent_wrapper.file_agent
-        elif hasattr(agent_wrapper, 'casual_agent'):
-            actual_agent = agent_wrapper.casual_agent
-        elif hasattr(agent_wrapper, 'planner_agent'):
-            actual_agent = agent_wrapper.planner_agent
-        else:
+        # Find the attribute holding the actual agent without building it yet
+        # (wrappers may expose it as a cached_property)
+        candidates = (f'{agent_name}_agent', 'browser_agent', 'code_agent', 'file_agent', 'casual_agent', 'planner_agent')
+        agent_attr = next((name for name in candidates
+                           if hasattr(type(agent_wrapper), name) or name in vars(agent_wrapper)), None)
+        if agent_attr is None:
             raise Exception(f"Could not find agent instance in {agent_name} wrapper")
         
-        # Create MCP server with the actual agent
-        server = BaseMCPAgentServer(agent_name, actual_agent)
+        # Create MCP server, the actual agent is built once the server is running
+        server = BaseMCPAgentServer(agent_name, agent_factory=functools.partial(getattr, agent_wrapper, agent_attr),
+                                    cache_responses=response_cache_opted_in(agent_name))
         
         # Run the server
         server.run(port)
         
     except Exception as e:
-        logger.error(f"❌ Failed to create {agent_name} agent server: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("❌ Failed to create %s agent server: %s", agent_name, e)
         sys.exit(1)
 
+# Opt-in with MCP_USE_FAST=1: swap in the Cython build of this module if one was compiled
+# (AGENTICSEEK_BUILD_FAST=1 python setup.py build_ext --inplace). Rebuild it after editing this file.
+if __name__ == "mcp_agents.base_mcp_agent_server" and os.getenv("MCP_USE_FAST") == "1":
+    try:
+        from mcp_agents._base_mcp_agent_server_fast import *  # noqa: F401,F403
+    except ImportError:
+        pass
+
 if __name__ == "__main__":
     """Test the base server"""
     
@@ -8,14 +8,16 @@ Handles general conversation, Q&A, and casual interactions.
 import sys
 import os
 import asyncio
-import configparser
+import functools
 
-# Add the parent directory to the path to import agent modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the repository root to the path when run as a plain script (python -m needs no help)
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp_agents.base_mcp_agent_server import create_agent_server
 from sources.agents.casual_agent import CasualAgent
 from sources.llm_provider import Provider
+from sources.tools.app_config import load_app_config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,40 +26,44 @@ class CasualAgentMCPServer:
     """Casual Agent MCP Server wrapper"""
     
     def __init__(self):
+        """Describe the casual agent, the agent itself is built on first use"""
+        self.capabilities = [
+            "general_conversation",
+            "question_answering",
+            "casual_chat",
+            "knowledge_queries",
+            "fallback_responses"
+        ]
+        self.description = "Casual agent for general conversation, Q&A, and fallback responses"
+        self.version = "1.0.0"
+    
+    @functools.cached_property
+    def casual_agent(self):
         """Initialize the casual agent"""
         try:
             # Load config
-            config = configparser.ConfigParser()
-            config.read('config.ini')
+            config = load_app_config()
             
             # Initialize provider
             provider = Provider(
-                provider_name=config["MAIN"]["provider_name"],
-                model=config["MAIN"]["provider_model"],
-                server_address=config["MAIN"]["provider_server_address"],
-                is_local=config.getboolean('MAIN', 'is_local')
+                provider_name=config.provider_name,
+                model=config.provider_model,
+                server_address=config.provider_server_address,
+                is_local=config.is_local
             )
             
             # Select personality folder
-            personality_folder = "jarvis" if config.getboolean('MAIN', 'jarvis_personality') else "base"
+            personality_folder = config.personality_folder
             
             # Initialize the casual agent
-            self.casual_agent = CasualAgent(
-                name=config["MAIN"]["agent_name"],
+            casual_agent = CasualAgent(
+                name=config.agent_name,
                 prompt_path=f"prompts/{personality_folder}/casual_agent.txt",
                 provider=provider,
                 verbose=False
             )
-            self.capabilities = [
-                "general_conversation",
-                "question_answering",
-                "casual_chat",
-                "knowledge_queries",
-                "fallback_responses"
-            ]
-            self.description = "Casual agent for general conversation, Q&A, and fallback responses"
-            self.version = "1.0.0"
             logger.info("✅ Casual Agent initialized successfully")
+            return casual_agent
         except Exception as e:
             logger.error(f"❌ Failed to initialize Casual Agent: {str(e)}")
             raise
@@ -8,14 +8,16 @@ Handles programming tasks, code generation, debugging, and file operations.
 import sys
 import os
 import asyncio
-import configparser
+import functools
 
-# Add the parent directory to the path to import agent modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the repository root to the path when run as a plain script (python -m needs no help)
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp_agents.base_mcp_agent_server import create_agent_server
 from sources.agents.code_agent import CoderAgent
 from sources.llm_provider import Provider
+from sources.tools.app_config import load_app_config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,40 +26,44 @@ class CodeAgentMCPServer:
     """Code Agent MCP Server wrapper"""
     
     def __init__(self):
+        """Describe the code agent, the agent itself is built on first use"""
+        self.capabilities = [
+            "code_generation",
+            "code_debugging",
+            "code_review",
+            "file_operations",
+            "code_execution"
+        ]
+        self.description = "Code agent for programming assistance, debugging, and development tasks"
+        self.version = "1.0.0"
+    
+    @functools.cached_property
+    def code_agent(self):
         """Initialize the code agent"""
         try:
             # Load config
-            config = configparser.ConfigParser()
-            config.read('config.ini')
+            config = load_app_config()
             
             # Initialize provider
             provider = Provider(
-                provider_name=config["MAIN"]["provider_name"],
-                model=config["MAIN"]["provider_model"],
-                server_address=config["MAIN"]["provider_server_address"],
-                is_local=config.getboolean('MAIN', 'is_local')
+                provider_name=config.provider_name,
+                model=config.provider_model,
+                server_address=config.provider_server_address,
+                is_local=config.is_local
             )
             
             # Select personality folder
-            personality_folder = "jarvis" if config.getboolean('MAIN', 'jarvis_personality') else "base"
+            personality_folder = config.personality_folder
             
             # Initialize the code agent
-            self.code_agent = CoderAgent(
+            code_agent = CoderAgent(
                 name="coder",
                 prompt_path=f"prompts/{personality_folder}/coder_agent.txt",
                 provider=provider,
                 verbose=False
             )
-            self.capabilities = [
-                "code_generation",
-                "code_debugging",
-                "code_review",
-                "file_operations",
-                "code_execution"
-            ]
-            self.description = "Code agent for programming assistance, debugging, and development tasks"
-            self.version = "1.0.0"
             logger.info("✅ Code Agent initialized successfully")
+            return code_agent
         except Exception as e:
             logger.error(f"❌ Failed to initialize Code Agent: {str(e)}")
             raise
@@ -7,27 +7,31 @@ Handles file operations, document management, and file system tasks.
 
 import sys
 import os
-import configparser
 import logging
-import fnmatch
+import functools
+import time
 
-# Add the parent directory to the path to import agent modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the repository root to the path when run as a plain script (python -m needs no help)
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp_agents.base_mcp_agent_server import create_agent_server
 from sources.agents.file_agent import FileAgent
 from sources.llm_provider import Provider
+from sources.tools.app_config import load_app_config
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
-def read_file_content(file_path):
+def read_file_content(file_path, limit=4096):
+    """Read and decode at most `limit` bytes from the start of a file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except UnicodeDecodeError:
-        return "[Binary or unreadable content]"
+        with open(file_path, "rb") as f:
+            data = f.read(limit)
+        if b"\x00" in data:
+            return "[Binary or unreadable content]"
+        return data.decode("utf-8", errors="replace")
     except Exception as e:
         logger.error(f"Failed to read file content: {e}")
         return None
@@ -37,66 +41,106 @@ class FileAgentMCPServer:
     """File Agent MCP Server wrapper"""
 
     def __init__(self):
+        self.base_dir = os.getcwd()
+        # filename -> paths under base_dir, built on the first lookup and rebuilt on misses or stale hits
+        self._file_index: dict[str, list[str]] | None = None
+        self._index_built_at = 0.0
+        self.index_rescan_interval = 5.0
+        self.capabilities = [
+            "file_reading",
+            "file_writing",
+            "file_management",
+            "directory_operations",
+            "document_processing"
+        ]
+        self.description = "File agent for file operations, document management, and file system tasks"
+        self.version = "1.0.0"
+        # Command prefix -> handler for handle()
+        self._commands = {"read file": self.read_file}
+
+    @functools.cached_property
+    def file_agent(self):
+        """Initialize the file agent on first use."""
         try:
             # Load config
-            config = configparser.ConfigParser()
-            config.read('config.ini')
+            config = load_app_config()
 
             # Initialize provider
             provider = Provider(
-                provider_name=config["MAIN"]["provider_name"],
-                model=config["MAIN"]["provider_model"],
-                server_address=config["MAIN"]["provider_server_address"],
-                is_local=config.getboolean('MAIN', 'is_local')
+                provider_name=config.provider_name,
+                model=config.provider_model,
+                server_address=config.provider_server_address,
+                is_local=config.is_local
             )
 
             # Select personality folder
-            personality_folder = "jarvis" if config.getboolean('MAIN', 'jarvis_personality') else "base"
+            personality_folder = config.personality_folder
 
             # Initialize the file agent
-            self.file_agent = FileAgent(
+            file_agent = FileAgent(
                 name="File Agent",
                 prompt_path=f"prompts/{personality_folder}/file_agent.txt",
                 provider=provider,
                 verbose=False
             )
-
-            self.base_dir = os.getcwd()
-            self.capabilities = [
-                "file_reading",
-                "file_writing",
-                "file_management",
-                "directory_operations",
-                "document_processing"
-            ]
-            self.description = "File agent for file operations, document management, and file system tasks"
-            self.version = "1.0.0"
             logger.info("✅ File Agent initialized successfully")
+            return file_agent
         except Exception as e:
             logger.error(f"❌ Failed to initialize File Agent: {str(e)}")
             raise
 
+    def _build_file_index(self):
+        """Index every file under base_dir by its name (iterative os.scandir walk)."""
+        index: dict[str, list[str]] = {}
+        stack = [self.base_dir]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    # DirEntry caches its type from the directory listing, no stat() per file
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        index.setdefault(entry.name, []).append(entry.path)
+        self._file_index = index
+        self._index_built_at = time.monotonic()
+        logger.info(f"📇 Indexed {sum(map(len, index.values()))} files under {self.base_dir}")
+
+    def _indexed_path(self, filename: str) -> str | None:
+        """First indexed path for filename that is still a file on disk."""
+        return next((path for path in self._file_index.get(filename, ()) if os.path.isfile(path)), None)
+
     def find_file_path(self, filename: str) -> str | None:
-        """Recursively search for the exact filename under base_dir."""
-        for root, dirs, files in os.walk(self.base_dir):
-            for f in files:
-                if f == filename:
-                    return os.path.join(root, f)
-        return None
+        """Look up the exact filename under base_dir, rescanning once if it is missing or was moved."""
+        if self._file_index is None:
+            self._build_file_index()
+        path = self._indexed_path(filename)
+        if path is None and time.monotonic() - self._index_built_at >= self.index_rescan_interval:
+            self._build_file_index()
+            path = self._indexed_path(filename)
+        return path
+
+    def read_file(self, filename: str) -> str:
+        """Handle a "read file <name>" command."""
+        file_path = self.find_file_path(filename)
+        if file_path:
+            content = read_file_content(file_path)
+            if content:
+                return f"✅ File '{filename}' found and read successfully.\n\n---\n{content[:1000]}..."
+            else:
+                return f"⚠️ File '{filename}' found but could not be read (possibly binary or corrupted)."
+        else:
+            return f"❌ File '{filename}' not found in directory: {self.base_dir}"
 
     def handle(self, message: str) -> str:
         """Main handler logic for MCP requests"""
-        if message.lower().startswith("read file"):
-            filename = message[9:].strip()
-            file_path = self.find_file_path(filename)
-            if file_path:
-                content = read_file_content(file_path)
-                if content:
-                    return f"✅ File '{filename}' found and read successfully.\n\n---\n{content[:1000]}..."
-                else:
-                    return f"⚠️ File '{filename}' found but could not be read (possibly binary or corrupted)."
-            else:
-                return f"❌ File '{filename}' not found in directory: {self.base_dir}"
+        # Only the prefix-length head of the message is lowercased
+        for prefix, handler in self._commands.items():
+            if message[:len(prefix)].lower() == prefix:
+                return handler(message[len(prefix):].strip())
         
         return "🤖 File Agent received an unsupported command."
 
@@ -8,14 +8,16 @@ Handles complex multi-step tasks, task planning, and agent orchestration.
 import sys
 import os
 import asyncio
-import configparser
+import functools
 
-# Add the parent directory to the path to import agent modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the repository root to the path when run as a plain script (python -m needs no help)
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp_agents.base_mcp_agent_server import create_agent_server
 from sources.agents.planner_agent import PlannerAgent
 from sources.llm_provider import Provider
+from sources.tools.app_config import load_app_config
 from sources.browser import Browser, create_driver
 import logging
 
@@ -25,50 +27,54 @@ class PlannerAgentMCPServer:
     """Planner Agent MCP Server wrapper"""
     
     def __init__(self):
-        """Initialize the planner agent"""
+        """Describe the planner agent, the agent itself is built on first use"""
+        self.capabilities = [
+            "task_planning",
+            "multi_step_coordination",
+            "workflow_management",
+            "agent_orchestration",
+            "complex_problem_solving"
+        ]
+        self.description = "Planner agent for complex multi-step tasks and workflow coordination"
+        self.version = "1.0.0"
+    
+    @functools.cached_property
+    def planner_agent(self):
+        """Initialize the planner agent (Selenium is not fork-safe, so this runs per worker)"""
         try:
             # Load config
-            config = configparser.ConfigParser()
-            config.read('config.ini')
+            config = load_app_config()
             
             # Initialize provider
             provider = Provider(
-                provider_name=config["MAIN"]["provider_name"],
-                model=config["MAIN"]["provider_model"],
-                server_address=config["MAIN"]["provider_server_address"],
-                is_local=config.getboolean('MAIN', 'is_local')
+                provider_name=config.provider_name,
+                model=config.provider_model,
+                server_address=config.provider_server_address,
+                is_local=config.is_local
             )
             
             # Initialize browser
-            stealth_mode = config.getboolean('BROWSER', 'stealth_mode')
-            languages = config["MAIN"]["languages"].split(' ')
+            stealth_mode = config.stealth_mode
+            languages = config.languages
             browser = Browser(
-                create_driver(headless=config.getboolean('BROWSER', 'headless_browser'), 
+                create_driver(headless=config.headless_browser, 
                              stealth_mode=stealth_mode, lang=languages[0]),
                 anticaptcha_manual_install=stealth_mode
             )
             
             # Select personality folder
-            personality_folder = "jarvis" if config.getboolean('MAIN', 'jarvis_personality') else "base"
+            personality_folder = config.personality_folder
             
             # Initialize the planner agent
-            self.planner_agent = PlannerAgent(
+            planner_agent = PlannerAgent(
                 name="Planner",
                 prompt_path=f"prompts/{personality_folder}/planner_agent.txt",
                 provider=provider,
                 verbose=False,
                 browser=browser
             )
-            self.capabilities = [
-                "task_planning",
-                "multi_step_coordination",
-                "workflow_management",
-                "agent_orchestration",
-                "complex_problem_solving"
-            ]
-            self.description = "Planner agent for complex multi-step tasks and workflow coordination"
-            self.version = "1.0.0"
             logger.info("✅ Planner Agent initialized successfully")
+            return planner_agent
         except Exception as e:
             logger.error(f"❌ Failed to initialize Planner Agent: {str(e)}")
             raise
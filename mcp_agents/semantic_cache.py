@@ -0,0 +1,102 @@
+"""
+Semantic Response Cache
+
+Second-tier cache for agent servers: returns a previous response when a new query
+is a near-duplicate (by sentence-embedding cosine similarity) of a recent one.
+"""
+
+import logging
+import threading
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """
+    Fixed-size FIFO of (query embedding, response) pairs
+
+    Embeddings are kept L2-normalized in one contiguous (capacity, dim) float32
+    matrix, so a lookup is a single matrix-vector product followed by an argmax.
+    The embedding model is loaded lazily on first use.
+    """
+
+    def __init__(self, capacity: int = 512, threshold: float = 0.93,
+                 model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        """
+        Args:
+            capacity: Maximum number of cached responses
+            threshold: Minimum cosine similarity for a cache hit
+            model_name: sentence-transformers model used to embed queries
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.model_name = model_name
+        self._model = None
+        self._embeddings: Optional[np.ndarray] = None
+        self._responses: list = [None] * capacity
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _get_model(self):
+        """Load the embedding model on first use"""
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+                logger.info("Loading semantic cache model %s", self.model_name)
+                self._model = SentenceTransformer(self.model_name)
+            return self._model
+
+    def embed(self, query: str) -> np.ndarray:
+        """
+        Embed a query as an L2-normalized float32 vector
+
+        Args:
+            query: The query text
+
+        Returns:
+            np.ndarray: The embedding
+        """
+        embedding = self._get_model().encode(query, normalize_embeddings=True)
+        return np.asarray(embedding, dtype=np.float32)
+
+    def lookup(self, query: str) -> Tuple[Optional[Any], np.ndarray]:
+        """
+        Find a cached response for a semantically equivalent query
+
+        Blocking (runs the embedding model), call it from a worker thread.
+
+        Args:
+            query: The query text
+
+        Returns:
+            Tuple of the cached response (or None) and the query embedding,
+            which can be passed to add() on a miss
+        """
+        embedding = self.embed(query)
+        with self._lock:
+            if self._size == 0:
+                return None, embedding
+            similarities = self._embeddings[:self._size] @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return self._responses[best], embedding
+        return None, embedding
+
+    def add(self, embedding: np.ndarray, response: Any):
+        """
+        Store a response, evicting the oldest entry when full
+
+        Args:
+            embedding: Query embedding returned by lookup()
+            response: The response to cache
+        """
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = np.zeros((self.capacity, embedding.shape[0]), dtype=np.float32)
+            self._embeddings[self._next] = embedding
+            self._responses[self._next] = response
+            self._next = (self._next + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
@@ -8,14 +8,16 @@ This agent can handle web search queries without browser automation.
 import sys
 import os
 import asyncio
-import configparser
+import functools
 
-# Add the parent directory to the path to import agent modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the repository root to the path when run as a plain script (python -m needs no help)
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp_agents.base_mcp_agent_server import create_agent_server
 from sources.agents.casual_agent import CasualAgent  # Use casual agent as base for now
 from sources.llm_provider import Provider
+from sources.tools.app_config import load_app_config
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,41 +26,44 @@ class SimpleBrowserAgentMCPServer:
     """Simple Browser Agent MCP Server wrapper"""
     
     def __init__(self):
+        """Describe the simple browser agent, the agent itself is built on first use"""
+        self.capabilities = [
+            "web_search_discussion",
+            "url_analysis", 
+            "web_content_discussion",
+            "search_strategy_advice"
+        ]
+        self.description = "Simple browser agent for web-related discussions without browser automation"
+        self.version = "1.0.0"
+    
+    @functools.cached_property
+    def browser_agent(self):
         """Initialize the simple browser agent"""
         try:
             # Load config
-            config = configparser.ConfigParser()
-            config.read('config.ini')
+            config = load_app_config()
             
             # Initialize provider
             provider = Provider(
-                provider_name=config["MAIN"]["provider_name"],
-                model=config["MAIN"]["provider_model"],
-                server_address=config["MAIN"]["provider_server_address"],
-                is_local=config.getboolean('MAIN', 'is_local')
+                provider_name=config.provider_name,
+                model=config.provider_model,
+                server_address=config.provider_server_address,
+                is_local=config.is_local
             )
             
             # Select personality folder
-            personality_folder = "jarvis" if config.getboolean('MAIN', 'jarvis_personality') else "base"
+            personality_folder = config.personality_folder
             
             # Initialize a casual agent as the base for browser functionality
             # This provides basic conversational abilities without browser automation
-            self.browser_agent = CasualAgent(
+            browser_agent = CasualAgent(
                 name="Simple Browser",
                 prompt_path=f"prompts/{personality_folder}/casual_agent.txt",
                 provider=provider,
                 verbose=False
             )
-            
-            self.capabilities = [
-                "web_search_discussion",
-                "url_analysis", 
-                "web_content_discussion",
-                "search_strategy_advice"
-            ]
-            self.description = "Simple browser agent for web-related discussions without browser automation"
-            self.version = "1.0.0"
             logger.info("✅ Simple Browser Agent initialized successfully")
+            return browser_agent
         except Exception as e:
             logger.error(f"❌ Failed to initialize Simple Browser Agent: {str(e)}")
             raise
@@ -5,15 +5,22 @@ Updated version of the main API that uses the MCP-based fault-tolerant router
 for enhanced reliability, fault isolation, and hot-swapping capabilities.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 import asyncio
+import contextlib
+import itertools
+import orjson
 import os
+import stat
 import sys
+import time
+import uuid
 from typing import Optional, Dict, Any
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime
 from mcp_fault_tolerant_router import fault_tolerant_router
 
@@ -32,21 +39,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global state for API responses
-latest_answer_data = {
-    "answer": "",
-    "reasoning": "",
-    "agent_name": "",
-    "status": "ready",
-    "blocks": {},
-    "done": False,
-    "uid": "",
-    "error": None,
-    "routing_info": {}
-}
+@dataclass(slots=True)
+class Answer:
+    """Answer record for one query, serialized directly by orjson"""
+    answer: str = ""
+    reasoning: str = ""
+    agent_name: str = ""
+    status: str = "ready"
+    blocks: dict = field(default_factory=dict)
+    done: bool = False
+    uid: str = ""
+    error: Optional[str] = None
+    routing_info: dict = field(default_factory=dict)
 
-current_query = ""
-processing_query = False
+@dataclass(slots=True)
+class QueryState:
+    """Most recent query and whether the worker is processing one"""
+    current_query: str = ""
+    processing_query: bool = False
+
+# Per-query answers keyed by uid (oldest evicted past MAX_ANSWERS), guarded by answers_lock
+MAX_ANSWERS = 256
+app.state.answers = {}
+app.state.answers_lock = asyncio.Lock()
+app.state.latest_uid = ""
+app.state.query_state = QueryState()
+
+# Query uids: a per-process random prefix (so uids from before a restart never match) plus a counter
+_UID_PREFIX = f"q_{uuid.uuid4().hex[:8]}_"
+_uid_counter = itertools.count(1)
+
+# Bounded queue of pending queries, drained by independent background workers
+QUERY_QUEUE_SIZE = 64
+QUERY_WORKERS = 8
+
+# (second, ISO string) for the health timestamp, which only needs one-second resolution
+_iso_cache = (0, "")
+
+def _iso_now() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    global _iso_cache
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _iso_cache[1]
+
+def _orjson_response(content: Any, status_code: int = 200) -> Response:
+    """Encode content with orjson, or pass pre-encoded JSON bytes through"""
+    body = content if isinstance(content, bytes) else orjson.dumps(content)
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+def _with_system_status(fields: Dict[str, Any], key: str, status_blob: bytes) -> bytes:
+    """Encode fields as a JSON object and splice the pre-encoded router status in under key"""
+    return orjson.dumps(fields)[:-1] + b',"' + key.encode() + b'":' + status_blob + b"}"
 
 class QueryRequest(BaseModel):
     """Request model for query endpoint"""
@@ -65,6 +110,9 @@ async def startup_event():
         logger.info("🚀 Starting AgenticSeek MCP API Server...")
         app.include_router(fault_tolerant_router.router)
         await fault_tolerant_router.initialize()
+        app.state.query_q = asyncio.Queue(maxsize=QUERY_QUEUE_SIZE)
+        app.state.query_workers = [asyncio.create_task(_query_worker(app.state.query_q))
+                                   for _ in range(QUERY_WORKERS)]
         logger.info("✅ MCP Router initialized successfully")
     except Exception as e:
         logger.error(f"❌ Failed to initialize MCP Router: {str(e)}")
@@ -75,6 +123,11 @@ async def shutdown_event():
     """Shutdown the MCP router on app shutdown"""
     try:
         logger.info("🛑 Shutting down AgenticSeek MCP API Server...")
+        workers = getattr(app.state, "query_workers", [])
+        for worker in workers:
+            worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.gather(*workers, return_exceptions=True)
         await fault_tolerant_router.shutdown()
         logger.info("✅ MCP Router shutdown complete")
     except Exception as e:
@@ -86,24 +139,23 @@ async def health_check():
     Health check endpoint for the API server
     """
     try:
-        # Get system status from the router
-        system_status = await fault_tolerant_router.get_system_status()
+        # Get the pre-encoded system status from the router
+        system_status = await fault_tolerant_router.get_system_status_bytes()
         
-        return {
+        return _orjson_response(_with_system_status({
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "api_version": "2.0.0",
             "mcp_enabled": True,
-            "system_status": system_status
-        }
+        }, "system_status", system_status))
     except Exception as e:
         logger.error(f"❌ Health check failed: {str(e)}")
-        return JSONResponse(
+        return _orjson_response(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             }
         )
 
@@ -112,48 +164,68 @@ async def query_endpoint(request: QueryRequest):
     """
     Process a user query using the MCP-based agent system
     """
-    global current_query, latest_answer_data, processing_query
+    state = app.state.query_state
     
     try:
         logger.info(f"📝 Received query: {request.query[:100]}...")
         
-        # Store query globally
-        current_query = request.query
-        processing_query = True
+        uid = f"{_UID_PREFIX}{next(_uid_counter):x}"
         
-        # Reset previous data
-        latest_answer_data = {
-            "answer": "",
-            "reasoning": "",
-            "agent_name": "",
-            "status": "processing",
-            "blocks": {},
-            "done": False,
-            "uid": f"query_{datetime.now().timestamp()}",
-            "error": None,
-            "routing_info": {}
-        }
+        # Hand the query to the background worker and register its pending answer.
+        # Both happen under the lock so the worker cannot report back before the entry exists.
+        async with app.state.answers_lock:
+            try:
+                app.state.query_q.put_nowait((uid, request))
+            except asyncio.QueueFull:
+                logger.warning("⚠️ Query queue full, rejecting query")
+                raise HTTPException(status_code=503, detail="Server busy, too many pending queries")
+            answers = app.state.answers
+            answers[uid] = Answer(uid=uid, status="processing")
+            app.state.latest_uid = uid
+            while len(answers) > MAX_ANSWERS:
+                del answers[next(iter(answers))]
         
-        # Start processing in background
-        asyncio.create_task(process_query_background(request))
+        # Store query globally
+        state.current_query = request.query
+        state.processing_query = True
         
         return {
             "status": "Query received, processing started",
-            "uid": latest_answer_data["uid"],
+            "uid": uid,
             "mcp_enabled": True
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Error in query endpoint: {str(e)}")
-        processing_query = False
+        state.processing_query = False
         raise HTTPException(status_code=500, detail=str(e))
 
-async def process_query_background(request: QueryRequest):
+async def _query_worker(queue: asyncio.Queue):
+    """
+    Route queued queries one at a time; QUERY_WORKERS of these run side by side
+    so a slow query only holds up its own worker
+    """
+    while True:
+        uid, request = await queue.get()
+        try:
+            await process_query_background(uid, request)
+        finally:
+            queue.task_done()
+
+async def _update_answer(uid: str, **fields: Any):
+    """Set fields on the answer for uid, if it has not been evicted"""
+    async with app.state.answers_lock:
+        answer = app.state.answers.get(uid)
+        if answer is not None:
+            for name, value in fields.items():
+                setattr(answer, name, value)
+
+async def process_query_background(uid: str, request: QueryRequest):
     """
     Process the query in the background using the MCP router
     """
-    global latest_answer_data, processing_query
-    
     try:
         logger.info(f"🔄 Processing query with MCP router: {request.query[:100]}...")
         
@@ -163,17 +235,17 @@ async def process_query_background(request: QueryRequest):
             selected_agent=request.selected_agent
         )
         
-        # Update global state with result
-        latest_answer_data.update({
-            "answer": result.get("answer", ""),
-            "reasoning": result.get("reasoning", ""),
-            "agent_name": result.get("agent_name", "unknown"),
-            "status": result.get("status", "completed"),
-            "blocks": result.get("blocks", {}),
-            "done": True,
-            "error": result.get("error"),
-            "routing_info": result.get("routing_info", {})
-        })
+        # Store the result for this query
+        await _update_answer(uid,
+            answer=result.get("answer", ""),
+            reasoning=result.get("reasoning", ""),
+            agent_name=result.get("agent_name", "unknown"),
+            status=result.get("status", "completed"),
+            blocks=result.get("blocks", {}),
+            done=True,
+            error=result.get("error"),
+            routing_info=result.get("routing_info", {})
+        )
         
         logger.info(f"✅ Query processed successfully by {result.get('agent_name', 'unknown')} agent")
         
@@ -181,26 +253,33 @@ async def process_query_background(request: QueryRequest):
         error_msg = f"Error processing query: {str(e)}"
         logger.error(f"❌ {error_msg}")
         
-        # Update global state with error
-        latest_answer_data.update({
-            "answer": f"I apologize, but I encountered an error: {str(e)}",
-            "reasoning": "The system experienced an unexpected error during processing.",
-            "agent_name": "system",
-            "status": "error",
-            "blocks": {},
-            "done": True,
-            "error": error_msg,
-            "routing_info": {"error": True}
-        })
+        # Store the error for this query
+        await _update_answer(uid,
+            answer=f"I apologize, but I encountered an error: {str(e)}",
+            reasoning="The system experienced an unexpected error during processing.",
+            agent_name="system",
+            status="error",
+            blocks={},
+            done=True,
+            error=error_msg,
+            routing_info={"error": True}
+        )
     finally:
-        processing_query = False
+        app.state.query_state.processing_query = False
 
 @app.get("/latest_answer")
-async def get_latest_answer():
+async def get_latest_answer(uid: Optional[str] = None):
     """
-    Get the latest answer from the agent system
+    Get the answer for a query uid, or the most recent query if no uid is given
     """
-    return latest_answer_data
+    async with app.state.answers_lock:
+        answer = app.state.answers.get(uid or app.state.latest_uid)
+        if answer is not None:
+            # Encoding under the lock snapshots the record, no copy needed
+            return _orjson_response(answer)
+    if uid:
+        raise HTTPException(status_code=404, detail=f"Unknown query uid: {uid}")
+    return _orjson_response(Answer())
 
 @app.get("/system_status")
 async def get_system_status():
@@ -208,14 +287,15 @@ async def get_system_status():
     Get comprehensive system status including all agents
     """
     try:
-        status = await fault_tolerant_router.get_system_status()
-        return {
+        status = await fault_tolerant_router.get_system_status_bytes()
+        state = app.state.query_state
+        current_query = state.current_query
+        return _orjson_response(_with_system_status({
             "api_status": "running",
             "mcp_enabled": True,
-            "processing_query": processing_query,
+            "processing_query": state.processing_query,
             "current_query": current_query[:100] + "..." if len(current_query) > 100 else current_query,
-            "system": status
-        }
+        }, "system", status))
     except Exception as e:
         logger.error(f"❌ Error getting system status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -228,7 +308,11 @@ async def restart_agent(request: AgentRestartRequest):
     try:
         logger.info(f"🔄 Manual restart requested for {request.agent_name} agent")
         
-        result = await fault_tolerant_router.restart_agent(request.agent_name)
+        try:
+            result = await fault_tolerant_router.restart_agent(request.agent_name)
+        finally:
+            # The agent's state changed (or may have), so don't serve the cached status
+            fault_tolerant_router.invalidate_status()
         
         if result["success"]:
             return {
@@ -251,10 +335,8 @@ async def stop_processing():
     """
     Stop current processing (legacy endpoint for frontend compatibility)
     """
-    global processing_query
-    
     logger.info("🛑 Stop processing requested")
-    processing_query = False
+    app.state.query_state.processing_query = False
     
     return {
         "status": "Processing stopped",
@@ -266,17 +348,15 @@ async def kill_process():
     """
     Emergency stop for all processing (legacy endpoint for frontend compatibility)
     """
-    global processing_query, latest_answer_data
-    
     logger.warning("🚨 Emergency kill process requested")
-    processing_query = False
+    app.state.query_state.processing_query = False
     
     # Update status
-    latest_answer_data.update({
-        "status": "terminated",
-        "answer": "Process terminated by user request",
-        "done": True
-    })
+    await _update_answer(app.state.latest_uid,
+        status="terminated",
+        answer="Process terminated by user request",
+        done=True
+    )
     
     return {
         "status": "Process killed",
@@ -284,17 +364,25 @@ async def kill_process():
     }
 
 @app.get("/screenshots/{filename}")
-async def get_screenshot(filename: str):
+async def get_screenshot(filename: str, request: Request):
     """
     Serve screenshot files (legacy endpoint for browser agent compatibility)
     """
     screenshot_path = os.path.join(".screenshots", filename)
     
-    if os.path.exists(screenshot_path):
-        return FileResponse(screenshot_path)
-    else:
-        # Return placeholder or 404
+    # A single stat serves the existence check, the response headers and the ETag
+    try:
+        st = os.stat(screenshot_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Screenshot not found")
+    if not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=404, detail="Screenshot not found")
+    
+    # Screenshots are polled; answer unchanged ones with 304 instead of resending them
+    etag = f'"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"etag": etag})
+    return FileResponse(screenshot_path, stat_result=st, headers={"etag": etag})
 
 @app.get("/agent_logs/{agent_name}")
 async def get_agent_logs(agent_name: str):
@@ -313,6 +401,7 @@ async def get_agent_logs(agent_name: str):
 
 if __name__ == "__main__":
     import uvicorn
+    from sources.utility import UVICORN_HTTP, UVICORN_LOOP
     
     logger.info("🚀 Starting AgenticSeek MCP API Server...")
     
@@ -322,6 +411,8 @@ if __name__ == "__main__":
             host="0.0.0.0",
             port=8000,
             reload=False,  # Disable reload to prevent issues with background tasks
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
             log_level="info"
         )
     except KeyboardInterrupt:
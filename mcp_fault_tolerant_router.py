@@ -1,16 +1,39 @@
 # mcp_fault_tolerant_router.py
+import copy
+import time
+from typing import Optional
+
+import orjson
 from fastapi import APIRouter
 
 class FaultTolerantRouter:
     def __init__(self):
         self.router = APIRouter()
+        # (monotonic build time, status) from get_system_status(), reused for _status_ttl seconds
+        self._status_cache: Optional[tuple[float, dict]] = None
+        self._status_ttl = 1.0
+        # orjson-encoded copy of the cached status, dropped whenever the status is rebuilt
+        self._status_blob: Optional[bytes] = None
         # (Other init logic...)
 
     async def initialize(self):
         # (Initialization logic...)
-        pass
+        self.invalidate_status()
 
     async def get_system_status(self):
+        # A copy, so a caller mutating the result cannot corrupt the cached status
+        return copy.deepcopy(self._cached_system_status())
+
+    def _cached_system_status(self):
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < self._status_ttl:
+            return cached[1]
+        status = self._build_system_status()
+        self._status_cache = (time.monotonic(), status)
+        self._status_blob = None
+        return status
+
+    def _build_system_status(self):
         # Example implementation — you can expand this as needed
         return {
             "status": "ok",
@@ -23,4 +46,17 @@ class FaultTolerantRouter:
                 {"name": "local_search_proxy", "port": 5001, "status": "unknown"},
             ]
         }
-fault_tolerant_router = FaultTolerantRouter()
\ No newline at end of file
+
+    async def get_system_status_bytes(self) -> bytes:
+        # Status is polled far more often than it changes, so serve the encoded copy
+        status = self._cached_system_status()
+        if self._status_blob is None:
+            self._status_blob = orjson.dumps(status)
+        return self._status_blob
+
+    def invalidate_status(self):
+        # Call whenever an agent's state changes (restart, health transition)
+        self._status_cache = None
+        self._status_blob = None
+
+fault_tolerant_router = FaultTolerantRouter()
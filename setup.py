@@ -1,5 +1,16 @@
+import os
 from setuptools import setup, find_packages
 
+# Optional Cython build of the MCP agent server request path
+ext_modules = []
+if os.getenv("AGENTICSEEK_BUILD_FAST") == "1":
+    from setuptools import Extension
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("mcp_agents._base_mcp_agent_server_fast", ["mcp_agents/base_mcp_agent_server.py"])],
+        language_level=3,
+    )
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -23,6 +34,15 @@ setup(
         "pydantic>=2.10.6",
         "pydantic_core>=2.27.2",
         "requests>=2.31.0",
+        "aiohttp>=3.9.0",
+        "cachetools>=5.3.0",
+        "orjson>=3.9.0",
+        "lxml>=5.0.0",
+        "flask-compress>=1.14",
+        "waitress>=3.0.0",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
+        "httptools>=0.6.0",
+        "gunicorn>=22.0.0; sys_platform != 'win32'",
         "sacremoses>=0.0.53",
         "numpy>=1.24.4",
         "colorama>=0.4.6",
@@ -57,7 +77,14 @@ setup(
         "sniffio",
         "tqdm>4"
     ],
+    ext_modules=ext_modules,
     extras_require={
+        "fast": [
+            "cython>=3.0",
+        ],
+        "semantic-cache": [
+            "sentence-transformers>=2.2.0",
+        ],
         "chinese": [
             "ordered_set",
             "pypinyin",
@@ -22,7 +22,8 @@ class Agent():
                        prompt_path:str,
                        provider,
                        verbose=False,
-                       browser=None) -> None:
+                       browser=None,
+                       prompt: str = None) -> None:
         """
         Args:
             name (str): Name of the agent.
@@ -31,9 +32,12 @@ class Agent():
             recover_last_session (bool, optional): Whether to recover the last conversation. 
             verbose (bool, optional): Enable verbose logging if True. Defaults to False.
             browser: The browser class for web navigation (only for browser agent).
+            prompt (str, optional): Preloaded content of prompt_path, skips reading the file.
         """
             
         self.agent_name = name
+        self.prompt_path = prompt_path
+        self.preloaded_prompt = prompt
         self.browser = browser
         self.role = None
         self.type = None
@@ -110,6 +114,8 @@ class Agent():
         return description
     
     def load_prompt(self, file_path: str) -> str:
+        if self.preloaded_prompt is not None and file_path == self.prompt_path:
+            return self.preloaded_prompt
         try:
             with open(file_path, 'r', encoding="utf-8") as f:
                 return f.read()
@@ -20,11 +20,11 @@ class Action(Enum):
     SEARCH = "SEARCH"
     
 class BrowserAgent(Agent):
-    def __init__(self, name, prompt_path, provider, verbose=False, browser=None):
+    def __init__(self, name, prompt_path, provider, verbose=False, browser=None, prompt=None):
         """
         The Browser agent is an agent that navigate the web autonomously in search of answer
         """
-        super().__init__(name, prompt_path, provider, verbose, browser)
+        super().__init__(name, prompt_path, provider, verbose, browser, prompt=prompt)
         self.tools = {
             "web_search": searxSearch(),
         }
@@ -9,11 +9,11 @@ from sources.tools.BashInterpreter import BashInterpreter
 from sources.memory import Memory
 
 class CasualAgent(Agent):
-    def __init__(self, name, prompt_path, provider, verbose=False):
+    def __init__(self, name, prompt_path, provider, verbose=False, prompt=None):
         """
         The casual agent is a special for casual talk to the user without specific tasks.
         """
-        super().__init__(name, prompt_path, provider, verbose, None)
+        super().__init__(name, prompt_path, provider, verbose, None, prompt=prompt)
         self.tools = {
         } # No tools for the casual agent
         self.role = "talk"
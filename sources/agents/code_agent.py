@@ -16,8 +16,8 @@ class CoderAgent(Agent):
     """
     The code agent is an agent that can write and execute code.
     """
-    def __init__(self, name, prompt_path, provider, verbose=False):
-        super().__init__(name, prompt_path, provider, verbose, None)
+    def __init__(self, name, prompt_path, provider, verbose=False, prompt=None):
+        super().__init__(name, prompt_path, provider, verbose, None, prompt=prompt)
         self.tools = {
             "bash": BashInterpreter(),
             "python": PyInterpreter(),
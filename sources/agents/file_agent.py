@@ -7,11 +7,11 @@ from sources.tools.BashInterpreter import BashInterpreter
 from sources.memory import Memory
 
 class FileAgent(Agent):
-    def __init__(self, name, prompt_path, provider, verbose=False):
+    def __init__(self, name, prompt_path, provider, verbose=False, prompt=None):
         """
         The file agent is a special agent for file operations.
         """
-        super().__init__(name, prompt_path, provider, verbose, None)
+        super().__init__(name, prompt_path, provider, verbose, None, prompt=prompt)
         self.tools = {
             "file_finder": FileFinder(),
             "bash": BashInterpreter()
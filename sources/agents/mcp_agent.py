@@ -10,12 +10,12 @@ from sources.memory import Memory
 
 class McpAgent(Agent):
 
-    def __init__(self, name, prompt_path, provider, verbose=False):
+    def __init__(self, name, prompt_path, provider, verbose=False, prompt=None):
         """
         The mcp agent is a special agent for using MCPs.
         MCP agent will be disabled if the user does not explicitly set the MCP_FINDER_API_KEY in environment variable.
         """
-        super().__init__(name, prompt_path, provider, verbose, None)
+        super().__init__(name, prompt_path, provider, verbose, None, prompt=prompt)
         keys = self.get_api_keys()
         self.tools = {
             "mcp_finder": MCP_finder(keys["mcp_finder"]),
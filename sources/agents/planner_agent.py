@@ -12,11 +12,11 @@ from sources.logger import Logger
 from sources.memory import Memory
 
 class PlannerAgent(Agent):
-    def __init__(self, name, prompt_path, provider, verbose=False, browser=None):
+    def __init__(self, name, prompt_path, provider, verbose=False, browser=None, prompt=None):
         """
         The planner agent is a special agent that divides and conquers the task.
         """
-        super().__init__(name, prompt_path, provider, verbose, None)
+        super().__init__(name, prompt_path, provider, verbose, None, prompt=prompt)
         self.tools = {
             "json": Tools()
         }
@@ -2,6 +2,7 @@ import os
 import platform
 import socket
 import subprocess
+import threading
 import time
 from urllib.parse import urlparse
 
@@ -9,11 +10,55 @@ import httpx
 import requests
 from dotenv import load_dotenv
 from ollama import Client as OllamaClient
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
 
 from sources.logger import Logger
 from sources.utility import pretty_print, animate_thinking
 
+# Keep-alive connection pools shared by every Provider in the process,
+# created on first use so forked workers each open their own
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_http_lock = threading.Lock()
+_http_client = None
+_http_session = None
+
+def get_http_client() -> httpx.Client:
+    """
+    Shared httpx client for the OpenAI-compatible SDK clients.
+    Keeps the SDK's own defaults (600s read / 5s connect timeout, follow_redirects) and only widens the pool.
+    """
+    global _http_client
+    with _http_lock:
+        if _http_client is None or _http_client.is_closed:
+            _http_client = DefaultHttpxClient(limits=HTTP_LIMITS)
+        return _http_client
+
+def get_http_session() -> requests.Session:
+    """
+    Shared requests session for the plain HTTP providers (server, lm-studio).
+    """
+    global _http_session
+    with _http_lock:
+        if _http_session is None:
+            _http_session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=HTTP_LIMITS.max_keepalive_connections)
+            _http_session.mount("http://", adapter)
+            _http_session.mount("https://", adapter)
+        return _http_session
+
+def close_http_clients():
+    """
+    Close the shared connection pools, they are recreated on next use.
+    """
+    global _http_client, _http_session
+    with _http_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
 class Provider:
     def __init__(self, provider_name, model, server_address="127.0.0.1:5000", is_local=False):
         self.provider_name = provider_name.lower()
@@ -127,12 +172,13 @@ class Provider:
             pretty_print(f"Server is offline at {self.server_ip}", color="failure")
 
         try:
-            requests.post(route_setup, json={"model": self.model})
-            requests.post(route_gen, json={"messages": history})
+            session = get_http_session()
+            session.post(route_setup, json={"model": self.model})
+            session.post(route_gen, json={"messages": history})
             is_complete = False
             while not is_complete:
                 try:
-                    response = requests.get(f"{self.server_ip}/get_updated_sentence")
+                    response = session.get(f"{self.server_ip}/get_updated_sentence")
                     if "error" in response.json():
                         pretty_print(response.json()["error"], color="failure")
                         break
@@ -216,11 +262,11 @@ class Provider:
                 host, port = base_url.split(':')
             except Exception as e:
                 port = "8000"
-            client = OpenAI(api_key=self.api_key, base_url=f"{self.internal_url}:{port}")
+            client = OpenAI(api_key=self.api_key, base_url=f"{self.internal_url}:{port}", http_client=get_http_client())
         elif self.is_local:
-            client = OpenAI(api_key=self.api_key, base_url=f"http://{base_url}")
+            client = OpenAI(api_key=self.api_key, base_url=f"http://{base_url}", http_client=get_http_client())
         else:
-            client = OpenAI(api_key=self.api_key)
+            client = OpenAI(api_key=self.api_key, http_client=get_http_client())
 
         try:
             response = client.chat.completions.create(
@@ -276,7 +322,7 @@ class Provider:
         if self.is_local:
             raise Exception("Google Gemini is not available for local use. Change config.ini")
 
-        client = OpenAI(api_key=self.api_key, base_url="https://generativelanguage.googleapis.com/v1beta/openai/")
+        client = OpenAI(api_key=self.api_key, base_url="https://generativelanguage.googleapis.com/v1beta/openai/", http_client=get_http_client())
         try:
             response = client.chat.completions.create(
                 model=self.model,
@@ -318,7 +364,7 @@ class Provider:
         """
         Use deepseek api to generate text.
         """
-        client = OpenAI(api_key=self.api_key, base_url="https://api.deepseek.com")
+        client = OpenAI(api_key=self.api_key, base_url="https://api.deepseek.com", http_client=get_http_client())
         if self.is_local:
             raise Exception("Deepseek (API) is not available for local use. Change config.ini")
         try:
@@ -348,7 +394,7 @@ class Provider:
         }
 
         try:
-            response = requests.post(route_start, json=payload, timeout=30)
+            response = get_http_session().post(route_start, json=payload, timeout=30)
             if response.status_code != 200:
                 raise Exception(f"LM Studio returned status {response.status_code}: {response.text}")
             if not response.text.strip():
@@ -386,7 +432,7 @@ class Provider:
         """
         Use OpenRouter API to generate text.
         """
-        client = OpenAI(api_key=self.api_key, base_url="https://openrouter.ai/api/v1")
+        client = OpenAI(api_key=self.api_key, base_url="https://openrouter.ai/api/v1", http_client=get_http_client())
         if self.is_local:
             # This case should ideally not be reached if unsafe_providers is set correctly
             # and is_local is False in config for openrouter
@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+
+from sources.tools import fast_config
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Settings resolved from config.ini, shared by the CLI and the agent servers"""
+    provider_name: str
+    provider_model: str
+    provider_server_address: str
+    is_local: bool
+    personality_folder: str
+    agent_name: str
+    languages: tuple[str, ...]
+    stealth_mode: bool
+    headless_browser: bool
+    speak: bool
+    listen: bool
+    recover_last_session: bool
+    save_session: bool
+
+def load_app_config(path: str = 'config.ini') -> AppConfig:
+    """
+    Resolve the settings from config.ini, re-parsing the file only when it changed on disk.
+    The provider and personality keys of [MAIN] are required, everything else has a default.
+    Args:
+        path (str): Path to the config file
+    Returns:
+        AppConfig: The resolved settings
+    Raises:
+        OSError: If the file cannot be read
+        KeyError: If a required key is missing
+        ValueError: If a boolean value is not recognized
+    """
+    config = fast_config.load(path)
+    main = config["MAIN"]
+    browser = config.get("BROWSER", {})
+    getboolean = fast_config.getboolean
+    return AppConfig(
+        provider_name=main["provider_name"],
+        provider_model=main["provider_model"],
+        provider_server_address=main["provider_server_address"],
+        is_local=getboolean(main["is_local"]),
+        personality_folder="jarvis" if getboolean(main["jarvis_personality"]) else "base",
+        agent_name=main.get("agent_name", "Jarvis"),
+        languages=tuple(main.get("languages", "en").split(' ')),
+        stealth_mode=getboolean(browser.get("stealth_mode", "False")),
+        headless_browser=getboolean(browser.get("headless_browser", "True")),
+        speak=getboolean(main.get("speak", "False")),
+        listen=getboolean(main.get("listen", "False")),
+        recover_last_session=getboolean(main.get("recover_last_session", "False")),
+        save_session=getboolean(main.get("save_session", "False")),
+    )
@@ -0,0 +1,104 @@
+import os
+import re
+
+# Same section header and option syntax configparser accepts by default
+_SECTION = re.compile(r'\[(?P<s>.+)\]')
+_OPTION = re.compile(r'(?P<k>.*?)\s*[=:]\s*(?P<v>.*)$')
+_BOOLEANS = {"1": True, "yes": True, "true": True, "on": True,
+             "0": False, "no": False, "false": False, "off": False}
+
+# Parsed files keyed by absolute path, each entry is (mtime_ns, sections)
+_CACHE: dict[str, tuple[int, dict[str, dict[str, str]]]] = {}
+
+def parse(text: str) -> dict[str, dict[str, str]]:
+    """
+    Parse ini text into {section: {key: value}} the way configparser reads it, without interpolation.
+    Handles `key = value` and `key: value` lines, indented continuation lines and DEFAULT inheritance.
+    Keys are lowercased, a repeated key keeps its last value.
+    Args:
+        text (str): The ini file content
+    Returns:
+        dict[str, dict[str, str]]: The parsed sections
+    Raises:
+        ValueError: On a line that is neither a section header, an option nor a comment
+    """
+    config = {}
+    section = None
+    key = None
+    indent = 0
+    for lineno, line in enumerate(text.splitlines(), 1):
+        stripped = line.strip()
+        if not stripped:
+            # Blank lines belong to a multi-line value until it ends (trailing ones are dropped below)
+            if section is not None and key is not None:
+                section[key].append('')
+            continue
+        if stripped[0] in '#;':
+            continue
+        line_indent = len(line) - len(line.lstrip())
+        if section is not None and key is not None and line_indent > indent:
+            section[key].append(stripped)
+            continue
+        indent = line_indent
+        header = _SECTION.match(stripped)
+        if header:
+            section = config.setdefault(header['s'], {})
+            key = None
+            continue
+        option = _OPTION.match(stripped)
+        if section is None or option is None or not option['k']:
+            raise ValueError(f"Invalid config line {lineno}: {line!r}")
+        key = option['k'].lower()
+        section[key] = [option['v'].strip()]
+    defaults = {k: '\n'.join(v).rstrip() for k, v in config.pop('DEFAULT', {}).items()}
+    parsed = {name: {**defaults, **{k: '\n'.join(v).rstrip() for k, v in values.items()}}
+              for name, values in config.items()}
+    if defaults:
+        parsed['DEFAULT'] = defaults
+    return parsed
+
+def read(path: str) -> dict[str, dict[str, str]]:
+    """
+    Read and parse an ini file.
+    Args:
+        path (str): Path to the ini file
+    Returns:
+        dict[str, dict[str, str]]: The parsed sections
+    """
+    with open(path, encoding="utf-8") as f:
+        return parse(f.read())
+
+def load(path: str) -> dict[str, dict[str, str]]:
+    """
+    Read and parse an ini file, re-parsing it only when its mtime changed.
+    The returned dict is shared between callers and must not be mutated.
+    Args:
+        path (str): Path to the ini file
+    Returns:
+        dict[str, dict[str, str]]: The parsed sections
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = os.path.abspath(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    sections = read(path)
+    _CACHE[path] = (mtime_ns, sections)
+    return sections
+
+def getboolean(value: str) -> bool:
+    """
+    Interpret a config value as a boolean, accepting the same words as configparser.
+    Args:
+        value (str): The raw config value
+    Returns:
+        bool: The boolean value
+    Raises:
+        ValueError: If the value is not one of 1/0, yes/no, true/false, on/off
+    """
+    try:
+        return _BOOLEANS[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}") from None
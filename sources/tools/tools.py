@@ -1,6 +1,7 @@
 import sys
 import os
-import configparser
+import functools
+import re
 from abc import abstractmethod
 
 # Ensure logger can be imported when running as a script or as part of a larger project
@@ -8,32 +9,89 @@ if __name__ == "__main__":
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sources.logger import Logger
+from sources.tools import fast_config
+
+def _load_config(path: str = './config.ini') -> dict[str, dict[str, str]] | None:
+    """
+    Load a config file as a plain {section: {key: value}} snapshot, parsing it only when it changed.
+    Args:
+        path (str): Path to the config file
+    Returns:
+        dict | None: The config snapshot, or None if the file does not exist
+    """
+    try:
+        return fast_config.load(path)
+    except FileNotFoundError:
+        return None
+
+@functools.cache
+def _tools_logger() -> Logger:
+    """
+    The tools.log logger shared by every Tools instance.
+    Each Logger opens its own file handler, so one per tool would leak a file descriptor per instance.
+    """
+    return Logger("tools.log")
+
+@functools.lru_cache(maxsize=None)
+def _block_pattern(tag: str) -> re.Pattern:
+    """
+    Compiled pattern matching a ```<tag> ... ``` block, the body is group 1.
+    """
+    return re.compile(re.escape(f'```{tag}') + r'(.*?)```', re.DOTALL)
+
+@functools.lru_cache(maxsize=128)
+def _parameter_pattern(parameter_name: str) -> re.Pattern:
+    """
+    Compiled pattern matching a `<parameter_name> = <value>` line, the value is group 1.
+    """
+    return re.compile(rf'^[ \t]*{re.escape(parameter_name)}[ \t]*=(.*)$', re.MULTILINE)
 
 class Tools():
     """
     Abstract class for all tools.
     """
+    # Directories save_block already created or found, shared by all tools to skip repeat makedirs calls
+    _known_dirs: set[str] = set()
+
     def __init__(self):
         self.tag = "undefined"
         self.name = "undefined"
         self.description = "undefined"
         self.client = None
         self.messages = []
-        self.logger = Logger("tools.log")
-        self.config = configparser.ConfigParser()
-        self._work_dir_initialized = False # Flag to ensure work_dir setup runs only once
-        self.work_dir = self.safe_get_work_dir_path() # Initialize work_dir safely
-        self.excutable_blocks_found = False
+        self.logger = _tools_logger()
+        # Bumped by every load_exec_block call that finds blocks; _exec_gen_seen backs found_executable_blocks()
+        self._exec_gen = 0
+        self._exec_gen_seen = 0
         self.safe_mode = True
         self.allow_language_exec_bash = False
+
+    @property
+    def tag(self) -> str:
+        """
+        The code block tag this tool executes (e.g. 'python').
+        """
+        return self._tag
+
+    @tag.setter
+    def tag(self, value: str) -> None:
+        # Precompute what load_exec_block needs, the tag is fixed once a tool is set up
+        self._tag = value
+        self._start_tag = f'```{value}'
+        self._block_re = _block_pattern(value)
     
+    @functools.cached_property
+    def work_dir(self) -> str:
+        """
+        The working directory, resolved and created on first access only.
+        """
+        return self._initialize_work_dir(self.logger)
+
     def get_work_dir(self):
         """
         Returns the path to the working directory.
         Ensures the work directory is initialized if it hasn't been already.
         """
-        if not self._work_dir_initialized:
-            self.work_dir = self.safe_get_work_dir_path()
         return self.work_dir
     
     def set_allow_language_exec_bash(self, value: bool) -> None:
@@ -46,12 +104,17 @@ class Tools():
 
     def config_exists(self):
         """Check if the config file exists."""
-        return os.path.exists('./config.ini')
+        return _load_config('./config.ini') is not None
 
-    def _initialize_work_dir(self) -> str:
+    @staticmethod
+    def _initialize_work_dir(logger: Logger) -> str:
         """
         Internal method to determine and create the work directory path.
         This method is called only when the work directory needs to be set up.
+        Args:
+            logger (Logger): Logger to report the chosen path on
+        Returns:
+            str: The work directory path
         """
         default_path = os.path.dirname(os.getcwd())
         path = None
@@ -60,28 +123,27 @@ class Tools():
         path = os.getenv('WORK_DIR', None)
 
         # 2. If not in env, try to get from config file
-        if path is None and self.config_exists():
-            self.config.read('./config.ini')
-            if 'MAIN' in self.config and 'work_dir' in self.config['MAIN']:
-                path = self.config['MAIN']['work_dir']
+        if path is None:
+            config = _load_config('./config.ini')
+            if config is not None and 'work_dir' in config.get('MAIN', {}):
+                path = config['MAIN']['work_dir']
         
         # 3. If still not found, use default path
         if path is None or path == "":
             print("No work directory specified, using default based on current working directory.")
-            self.logger.warning("No WORK_DIR environment variable or 'work_dir' in config.ini found. Using default path.")
+            logger.warning("No WORK_DIR environment variable or 'work_dir' in config.ini found. Using default path.")
             path = default_path
 
         # Create the directory if it doesn't exist
         if not os.path.exists(path):
             try:
                 os.makedirs(path, exist_ok=True) # exist_ok=True prevents error if dir already exists
-                self.logger.info(f"Created work directory at: {path}")
+                logger.info(f"Created work directory at: {path}")
             except OSError as e:
-                self.logger.error(f"Error creating work directory '{path}': {e}")
+                logger.error(f"Error creating work directory '{path}': {e}")
                 # Fallback or raise an error if directory creation fails critically
                 raise
         
-        self._work_dir_initialized = True
         return path
 
     def safe_get_work_dir_path(self) -> str:
@@ -90,8 +152,6 @@ class Tools():
         If the work directory hasn't been initialized, it initializes it.
         This acts as the public interface for getting the work directory.
         """
-        if not self._work_dir_initialized:
-            self.work_dir = self._initialize_work_dir()
         return self.work_dir
 
     @abstractmethod
@@ -150,17 +210,23 @@ class Tools():
         # Combine base_work_dir with the directory from save_path
         directory_to_create = os.path.join(base_work_dir, save_path_dir)
         
-        if directory_to_create and not os.path.exists(directory_to_create):
+        if directory_to_create and directory_to_create not in Tools._known_dirs:
             self.logger.info(f"Creating directory {directory_to_create}")
             os.makedirs(directory_to_create, exist_ok=True) # Ensure it's created safely
+            Tools._known_dirs.add(directory_to_create)
         
         full_file_path = os.path.join(directory_to_create, save_path_file)
         try:
-            with open(full_file_path, 'w') as f:
-                for block in blocks:
-                    f.write(block)
-                    if not block.endswith('\n'): # Add newline if not present
-                        f.write('\n') 
+            # Newline-terminate every block and write them in one call
+            payload = ''.join(block if block.endswith('\n') else block + '\n' for block in blocks)
+            try:
+                f = open(full_file_path, 'w')
+            except FileNotFoundError:
+                # The directory was removed since it was cached, create it again
+                os.makedirs(directory_to_create, exist_ok=True)
+                f = open(full_file_path, 'w')
+            with f:
+                f.write(payload)
             self.logger.info(f"Successfully saved blocks to {full_file_path}")
         except IOError as e:
             self.logger.error(f"Error saving blocks to {full_file_path}: {e}")
@@ -175,23 +241,31 @@ class Tools():
         Returns:
             str: The value of the parameter, or None if not found.
         """
-        for param_line in block.split('\n'):
-            if parameter_name in param_line:
-                parts = param_line.split('=', 1) # Split only on the first '='
-                if len(parts) > 1:
-                    return parts[1].strip()
-        return None
+        match = _parameter_pattern(parameter_name).search(block)
+        return match.group(1).strip() if match else None
     
-    def found_executable_blocks(self) -> bool:
+    @property
+    def exec_generation(self) -> int:
         """
-        Check if executable blocks were found in the last `load_exec_block` call.
-        Resets the flag after checking.
+        Counter incremented each time `load_exec_block` finds blocks.
+        Snapshot it and pass it to `found_executable_blocks(since=...)` to check without shared resets.
+        """
+        return self._exec_gen
+
+    def found_executable_blocks(self, since: int | None = None) -> bool:
+        """
+        Check if executable blocks were found by `load_exec_block`.
+        Without `since`, reports blocks found since the previous check and resets it.
+        Args:
+            since (int | None): An `exec_generation` snapshot to compare against, nothing is reset
         Returns:
             bool: True if executable blocks were found, False otherwise.
         """
-        tmp = self.excutable_blocks_found
-        self.excutable_blocks_found = False # Reset the flag
-        return tmp
+        if since is not None:
+            return self._exec_gen != since
+        found = self._exec_gen != self._exec_gen_seen
+        self._exec_gen_seen = self._exec_gen
+        return found
 
     def load_exec_block(self, llm_text: str) -> tuple[list[str], str | None]:
         """
@@ -208,41 +282,28 @@ class Tools():
             self.logger.error("Tool tag is 'undefined'. Cannot load executable blocks.")
             assert False, "Tag not defined"
             
-        start_tag = f'```{self.tag}' 
-        end_tag = '```'
-        code_blocks = []
-        start_index = 0
         save_path = None
 
-        if start_tag not in llm_text:
+        # Every block opens with the start tag, so its count bounds the number of blocks
+        n_tags = llm_text.count(self._start_tag)
+        if n_tags == 0:
             return [], None # Return empty list, not None, to be consistent with type hint
+        code_blocks = [None] * n_tags
+        n_blocks = 0
 
-        while True:
-            start_pos = llm_text.find(start_tag, start_index)
-            if start_pos == -1:
-                break
+        # One pass over the text; an opening tag without a closing tag ends the scan
+        for match in self._block_re.finditer(llm_text):
+            start_pos = match.start()
 
             # Find the start of the line containing start_tag to check for leading whitespace
             line_start = llm_text.rfind('\n', 0, start_pos) + 1
             leading_whitespace = llm_text[line_start:start_pos]
 
-            end_pos = llm_text.find(end_tag, start_pos + len(start_tag))
-            if end_pos == -1:
-                # If an opening tag is found but no closing tag, break to avoid infinite loop
-                break 
-            
-            content = llm_text[start_pos + len(start_tag):end_pos]
+            content = match.group(1)
             
             # Remove leading whitespace from each line if the block itself is indented
             if leading_whitespace:
-                lines = content.split('\n')
-                processed_lines = []
-                for line in lines:
-                    if line.startswith(leading_whitespace):
-                        processed_lines.append(line[len(leading_whitespace):])
-                    else:
-                        processed_lines.append(line)
-                content = '\n'.join(processed_lines)
+                content = re.sub('^' + re.escape(leading_whitespace), '', content, flags=re.MULTILINE)
 
             # Check for save_path in the first line of the block content
             first_line = content.split('\n', 1)[0] # Get only the first line
@@ -258,10 +319,12 @@ class Tools():
                    content = content[content.find('\n')+1:] # Remove the path line
 
 
-            self.excutable_blocks_found = True
-            code_blocks.append(content)
-            start_index = end_pos + len(end_tag)
+            code_blocks[n_blocks] = content
+            n_blocks += 1
             
+        del code_blocks[n_blocks:] # Drop slots of unclosed or nested tags
+        if n_blocks:
+            self._exec_gen += 1
         self.logger.info(f"Found {len(code_blocks)} blocks to execute")
         return code_blocks, save_path
     
@@ -277,7 +340,7 @@ if __name__ == "__main__":
     print("--- Testing Tools Class Initialization and Work Dir Handling ---")
     tool = Tools()
     print(f"Tool initialized. Work directory: {tool.get_work_dir()}")
-    print(f"Is work directory initialized flag set? {tool._work_dir_initialized}")
+    print(f"Is work directory initialized? {'work_dir' in vars(tool)}")
 
     # Test re-getting work dir
     another_tool_instance = Tools() # Simulate another instance
@@ -1,6 +1,8 @@
 
 from colorama import Fore
 from termcolor import colored
+import asyncio
+import importlib.util
 import platform
 import threading
 import itertools
@@ -9,6 +11,19 @@ import time
 thinking_event = threading.Event()
 current_animation_thread = None
 
+# Prefer the C-accelerated event loop and HTTP parser when installed
+# (uvloop is not available on Windows)
+UVICORN_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+UVICORN_HTTP = "httptools" if importlib.util.find_spec("httptools") else "auto"
+
+def use_uvloop():
+    """
+    Make asyncio.run use the libuv-based event loop when uvloop is installed.
+    """
+    if UVICORN_LOOP == "uvloop":
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 def get_color_map():
     if platform.system().lower() != "windows":
         color_map = {
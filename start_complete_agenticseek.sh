@@ -47,19 +47,19 @@ echo "[1/7] Local Search Proxy..."
 nohup python3 local_search.py > logs/local_search.log 2>&1 &
 
 echo "[2/7] Code Agent Server..."
-nohup python3 mcp_agents/code_agent_server.py 8002 > logs/code_agent.log 2>&1 &
+nohup python3 -m mcp_agents.code_agent_server 8002 > logs/code_agent.log 2>&1 &
 
 echo "[3/7] File Agent Server..."
-nohup python3 mcp_agents/file_agent_server.py 8003 > logs/file_agent.log 2>&1 &
+nohup python3 -m mcp_agents.file_agent_server 8003 > logs/file_agent.log 2>&1 &
 
 echo "[4/7] Casual Agent Server..."
-nohup python3 mcp_agents/casual_agent_server.py 8004 > logs/casual_agent.log 2>&1 &
+nohup python3 -m mcp_agents.casual_agent_server 8004 > logs/casual_agent.log 2>&1 &
 
 echo "[5/7] Planner Agent Server..."
-nohup python3 mcp_agents/planner_agent_server.py 8005 > logs/planner_agent.log 2>&1 &
+nohup python3 -m mcp_agents.planner_agent_server 8005 > logs/planner_agent.log 2>&1 &
 
 echo "[6/7] Simple Browser Agent Server..."
-nohup python3 mcp_agents/simple_browser_agent_server.py 8001 > logs/browser_agent.log 2>&1 &
+nohup python3 -m mcp_agents.simple_browser_agent_server 8001 > logs/browser_agent.log 2>&1 &
 
 echo "[7/7] Main MCP API Server..."
 nohup python3 mcp_api.py > logs/main_api.log 2>&1 &
@@ -43,23 +43,23 @@ start "Local Search Proxy" cmd /k "echo Local Search Proxy & python local_search
 timeout /t 3
 
 echo [2/7] 🌐 Starting Browser Agent Server (Port 8001)...
-start "Browser Agent" cmd /k "echo Browser Agent Server & python mcp_agents\browser_agent_server.py 8001"
+start "Browser Agent" cmd /k "echo Browser Agent Server & python -m mcp_agents.browser_agent_server 8001"
 timeout /t 2
 
 echo [3/7] 💻 Starting Code Agent Server (Port 8002)...
-start "Code Agent" cmd /k "echo Code Agent Server & python mcp_agents\code_agent_server.py 8002"
+start "Code Agent" cmd /k "echo Code Agent Server & python -m mcp_agents.code_agent_server 8002"
 timeout /t 2
 
 echo [4/7] 📁 Starting File Agent Server (Port 8003)...
-start "File Agent" cmd /k "echo File Agent Server & python mcp_agents\file_agent_server.py 8003"
+start "File Agent" cmd /k "echo File Agent Server & python -m mcp_agents.file_agent_server 8003"
 timeout /t 2
 
 echo [5/7] 💬 Starting Casual Agent Server (Port 8004)...
-start "Casual Agent" cmd /k "echo Casual Agent Server & python mcp_agents\casual_agent_server.py 8004"
+start "Casual Agent" cmd /k "echo Casual Agent Server & python -m mcp_agents.casual_agent_server 8004"
 timeout /t 2
 
 echo [6/7] 📋 Starting Planner Agent Server (Port 8005)...
-start "Planner Agent" cmd /k "echo Planner Agent Server & python mcp_agents\planner_agent_server.py 8005"
+start "Planner Agent" cmd /k "echo Planner Agent Server & python -m mcp_agents.planner_agent_server 8005"
 timeout /t 3
 
 echo [7/7] 🎯 Starting Main MCP API Server (Port 8000)...
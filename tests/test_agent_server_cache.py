@@ -0,0 +1,67 @@
+import unittest
+import os, sys
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Add project root to Python path
+
+from fastapi.testclient import TestClient
+from mcp_agents.base_mcp_agent_server import BaseMCPAgentServer, response_cache_opted_in
+
+class CountingAgent:
+    """Agent recording every query it actually runs."""
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, query):
+        self.calls.append(query)
+        return {"answer": f"answer {len(self.calls)}", "reasoning": "", "status": "completed", "blocks": {}}
+
+class TestAgentServerResponseCache(unittest.TestCase):
+    """
+    Test suite for the /query response cache of BaseMCPAgentServer.
+    """
+    def make_client(self, **kwargs):
+        self.agent = CountingAgent()
+        server = BaseMCPAgentServer("mock", self.agent, **kwargs)
+        return server, TestClient(server.app)
+
+    def test_cache_off_by_default(self):
+        """Test that repeated queries run the agent again unless caching is requested."""
+        server, client = self.make_client()
+        self.assertFalse(server.cache_enabled)
+        first = client.post("/query", json={"query": "run the script"})
+        second = client.post("/query", json={"query": "run the script"})
+        self.assertEqual(self.agent.calls, ["run the script", "run the script"])
+        self.assertNotEqual(first.json()["answer"], second.json()["answer"])
+        self.assertIsNone(second.headers.get("x-cache"))
+
+    def test_cache_hit_when_enabled(self):
+        """Test that an identical query is served from the cache when caching is on."""
+        server, client = self.make_client(cache_responses=True)
+        first = client.post("/query", json={"query": "hello", "context": {"a": 1, "b": 2}})
+        second = client.post("/query", json={"query": "hello", "context": {"b": 2, "a": 1}})
+        self.assertEqual(first.headers.get("x-cache"), "MISS")
+        self.assertEqual(second.headers.get("x-cache"), "HIT")
+        self.assertEqual(first.json(), second.json())
+        self.assertEqual(self.agent.calls, ["hello"])
+
+    def test_cache_miss_on_different_context(self):
+        """Test that the same query with another context is not a cache hit."""
+        server, client = self.make_client(cache_responses=True)
+        client.post("/query", json={"query": "hello", "context": {"a": 1}})
+        response = client.post("/query", json={"query": "hello", "context": {"a": 2}})
+        self.assertEqual(response.headers.get("x-cache"), "MISS")
+        self.assertEqual(len(self.agent.calls), 2)
+
+    def test_response_cache_opt_in(self):
+        """Test that no agent is cached unless listed in RESPONSE_CACHE_AGENTS."""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            for name in ("casual", "code", "file", "planner", "browser"):
+                self.assertFalse(response_cache_opted_in(name))
+        with mock.patch.dict(os.environ, {"RESPONSE_CACHE_AGENTS": "casual, file"}):
+            self.assertTrue(response_cache_opted_in("casual"))
+            self.assertTrue(response_cache_opted_in("file"))
+            self.assertFalse(response_cache_opted_in("code"))
+
+if __name__ == '__main__':
+    unittest.main()
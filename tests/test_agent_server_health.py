@@ -0,0 +1,56 @@
+import unittest
+import os, sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Add project root to Python path
+
+from fastapi.testclient import TestClient
+from mcp_agents.base_mcp_agent_server import BaseMCPAgentServer
+
+class MockAgent:
+    async def execute(self, query):
+        return {"answer": query}
+
+class TestAgentServerHealth(unittest.TestCase):
+    """
+    Test suite for the /health readiness reporting of BaseMCPAgentServer.
+    """
+    def test_starting_until_agent_built(self):
+        """Test that /health answers 503 'starting' while the agent is still being built."""
+        release = threading.Event()
+        def factory():
+            release.wait(5)
+            return MockAgent()
+        server = BaseMCPAgentServer("mock", agent_factory=factory)
+        with TestClient(server.app) as client:
+            response = client.get("/health")
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.json()["status"], "starting")
+            release.set()
+            server._load_agent()  # Waits for the warm-up build to finish
+            response = client.get("/health")
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["status"], "healthy")
+
+    def test_unhealthy_when_build_fails(self):
+        """Test that /health answers 503 'unhealthy' with the error when the agent cannot be built."""
+        def factory():
+            raise RuntimeError("no driver")
+        server = BaseMCPAgentServer("mock", agent_factory=factory)
+        with self.assertLogs("mcp_agents.base_mcp_agent_server", level="ERROR"):
+            with TestClient(server.app) as client:
+                for _ in range(100):
+                    if server._agent_error is not None:
+                        break
+                    threading.Event().wait(0.01)
+                response = client.get("/health")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"status": "unhealthy", "agent": "mock", "error": "no driver"})
+
+    def test_healthy_with_prebuilt_agent(self):
+        """Test that an agent passed in directly is reported healthy immediately."""
+        client = TestClient(BaseMCPAgentServer("mock", MockAgent()).app)
+        self.assertEqual(client.head("/health").status_code, 200)
+
+if __name__ == '__main__':
+    unittest.main()
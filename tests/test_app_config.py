@@ -0,0 +1,48 @@
+import unittest
+import os, sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Add project root to Python path
+
+from sources.tools.app_config import load_app_config
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config.ini')
+
+class TestAppConfig(unittest.TestCase):
+    """
+    Test suite for resolving config.ini into an AppConfig.
+    """
+    def load_text(self, text):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.ini')
+            with open(path, 'w', encoding="utf-8") as f:
+                f.write(text)
+            return load_app_config(path)
+
+    def test_shipped_config(self):
+        """Test that the repository config.ini resolves with the expected types."""
+        config = load_app_config(CONFIG_PATH)
+        self.assertIsInstance(config.languages, tuple)
+        self.assertIn(config.personality_folder, ("jarvis", "base"))
+        self.assertIsInstance(config.save_session, bool)
+
+    def test_defaults(self):
+        """Test that only the provider and personality keys are required."""
+        config = self.load_text("[MAIN]\nprovider_name = ollama\nprovider_model = m\n"
+                                "provider_server_address = 127.0.0.1:11434\nis_local = True\n"
+                                "jarvis_personality = False\n")
+        self.assertEqual(config.agent_name, "Jarvis")
+        self.assertEqual(config.languages, ("en",))
+        self.assertEqual(config.personality_folder, "base")
+        self.assertTrue(config.headless_browser)
+        self.assertFalse(config.stealth_mode)
+        self.assertFalse(config.speak)
+        self.assertFalse(config.save_session)
+
+    def test_missing_required_key(self):
+        """Test that a missing provider key raises KeyError."""
+        with self.assertRaises(KeyError):
+            self.load_text("[MAIN]\nprovider_name = ollama\n")
+
+if __name__ == '__main__':
+    unittest.main()
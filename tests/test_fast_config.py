@@ -0,0 +1,87 @@
+import unittest
+import os, sys
+import configparser
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Add project root to Python path
+
+from sources.tools import fast_config
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config.ini')
+
+def configparser_dict(text):
+    """Parse text with configparser and return it in fast_config's shape."""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_string(text)
+    config = {name: dict(parser[name]) for name in parser.sections()}
+    if parser.defaults():
+        config['DEFAULT'] = dict(parser.defaults())
+    return config
+
+class TestFastConfig(unittest.TestCase):
+    """
+    Test suite for fast_config, checked against configparser.
+    """
+    def assertSameAsConfigparser(self, text):
+        self.assertEqual(fast_config.parse(text), configparser_dict(text))
+
+    def test_shipped_config(self):
+        """Test that the repository config.ini parses the same as with configparser."""
+        with open(CONFIG_PATH, encoding="utf-8") as f:
+            text = f.read()
+        self.assertSameAsConfigparser(text)
+        self.assertEqual(fast_config.read(CONFIG_PATH), configparser_dict(text))
+
+    def test_colon_delimiter(self):
+        """Test `key: value` lines, including a value that itself contains = or :."""
+        self.assertSameAsConfigparser("[MAIN]\nprovider_name: ollama\nurl: http://x:1/?a=b\nk = v: w\n")
+
+    def test_continuation_lines(self):
+        """Test that indented lines continue the previous value, blank lines included."""
+        self.assertSameAsConfigparser("[MAIN]\nlanguages = en\n    fr\n\n    zh\nnext = 1\n\n")
+
+    def test_comments_and_case(self):
+        """Test full-line comments, key lowercasing and surrounding whitespace."""
+        self.assertSameAsConfigparser("# top\n[MAIN]\n; note\n  Agent_Name   =   Jarvis  \nempty =\n")
+
+    def test_default_section(self):
+        """Test that DEFAULT values are inherited and can be overridden."""
+        self.assertSameAsConfigparser("[DEFAULT]\nspeak = False\n[MAIN]\nlisten = True\n[BROWSER]\nspeak = True\n")
+
+    def test_invalid_line(self):
+        """Test that a line without a delimiter is rejected like configparser does."""
+        with self.assertRaises(configparser.Error):
+            configparser_dict("[MAIN]\njust text\n")
+        with self.assertRaises(ValueError):
+            fast_config.parse("[MAIN]\njust text\n")
+        with self.assertRaises(ValueError):
+            fast_config.parse("key = outside a section\n")
+
+    def test_load_reparses_on_change(self):
+        """Test that load caches a file and re-reads it when its mtime changes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'config.ini')
+            with open(path, 'w', encoding="utf-8") as f:
+                f.write("[MAIN]\nspeak = False\n")
+            first = fast_config.load(path)
+            self.assertIs(fast_config.load(path), first)
+            with open(path, 'w', encoding="utf-8") as f:
+                f.write("[MAIN]\nspeak = True\n")
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(fast_config.load(path), {'MAIN': {'speak': 'True'}})
+            os.remove(path)
+            with self.assertRaises(FileNotFoundError):
+                fast_config.load(path)
+
+    def test_getboolean(self):
+        """Test boolean values against configparser's accepted words."""
+        for word, expected in configparser.ConfigParser.BOOLEAN_STATES.items():
+            self.assertIs(fast_config.getboolean(word), expected)
+            self.assertIs(fast_config.getboolean(f" {word.upper()} "), expected)
+        for word in ("", "maybe", "2", "y"):
+            with self.assertRaises(ValueError):
+                fast_config.getboolean(word)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os, sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Add project root to Python path
+
+from mcp_agents.semantic_cache import SemanticCache
+
+def unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+class FixedEmbeddingCache(SemanticCache):
+    """SemanticCache with hand-picked embeddings instead of a sentence-transformers model."""
+    def __init__(self, embeddings, **kwargs):
+        super().__init__(**kwargs)
+        self.embeddings = embeddings
+
+    def embed(self, query):
+        return self.embeddings[query]
+
+class TestSemanticCache(unittest.TestCase):
+    """
+    Test suite for the SemanticCache hit/miss threshold.
+    """
+    def setUp(self):
+        # cos(base, near) ~ 0.995, cos(base, far) ~ 0.707, just above / just below the 0.93 threshold
+        self.cache = FixedEmbeddingCache({
+            "base": unit(1, 0, 0),
+            "near": unit(1, 0.1, 0),
+            "far": unit(1, 1, 0),
+            "above": unit(0.931, np.sqrt(1 - 0.931 ** 2), 0),
+            "below": unit(0.929, np.sqrt(1 - 0.929 ** 2), 0),
+            "other": unit(0, 0, 1),
+        }, capacity=2, threshold=0.93)
+
+    def test_empty_cache_misses(self):
+        """Test that a lookup on an empty cache misses and returns the embedding."""
+        response, embedding = self.cache.lookup("base")
+        self.assertIsNone(response)
+        self.assertEqual(embedding.shape, (3,))
+
+    def test_hit_above_threshold(self):
+        """Test that a near-duplicate query returns the cached response."""
+        _, embedding = self.cache.lookup("base")
+        self.cache.add(embedding, b"base answer")
+        response, _ = self.cache.lookup("near")
+        self.assertEqual(response, b"base answer")
+
+    def test_miss_below_threshold(self):
+        """Test that a dissimilar query misses."""
+        _, embedding = self.cache.lookup("base")
+        self.cache.add(embedding, b"base answer")
+        response, _ = self.cache.lookup("far")
+        self.assertIsNone(response)
+
+    def test_threshold_boundary(self):
+        """Test that similarities just above the threshold hit and just below miss."""
+        _, embedding = self.cache.lookup("base")
+        self.cache.add(embedding, b"base answer")
+        self.assertEqual(self.cache.lookup("above")[0], b"base answer")
+        self.assertIsNone(self.cache.lookup("below")[0])
+
+    def test_oldest_entry_evicted(self):
+        """Test that adding past capacity evicts the oldest response."""
+        for query in ("base", "far", "other"):
+            _, embedding = self.cache.lookup(query)
+            self.cache.add(embedding, query)
+        self.assertIsNone(self.cache.lookup("base")[0])
+        self.assertEqual(self.cache.lookup("other")[0], "other")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -214,6 +214,23 @@ print("test")
         
         self.assertFalse(self.tool.found_executable_blocks())
 
+    def test_found_executable_blocks_since_generation(self):
+        """Test checking for blocks against an exec_generation snapshot."""
+        gen = self.tool.exec_generation
+        self.assertFalse(self.tool.found_executable_blocks(since=gen))
+
+        self.tool.load_exec_block("no code here")
+        self.assertFalse(self.tool.found_executable_blocks(since=gen))
+
+        self.tool.load_exec_block("""```python
+print("test")
+```""")
+
+        self.assertTrue(self.tool.found_executable_blocks(since=gen))
+        # Checking against a snapshot does not consume the result
+        self.assertTrue(self.tool.found_executable_blocks(since=gen))
+        self.assertTrue(self.tool.found_executable_blocks())
+
     def test_get_parameter_value(self):
         """Test the get_parameter_value helper method."""
         block = """param1 = value1